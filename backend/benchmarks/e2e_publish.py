@@ -0,0 +1,240 @@
+"""
+스캔 -> 매칭 -> 퍼블리시 end-to-end 벤치마크.
+
+로컬 mock Kitsu 서버(mock_kitsu.py)와 백엔드 API 서버를 띄우고, 임시 디렉터리에 가상 렌더 파일을
+만든 뒤 프론트엔드와 같은 순서로 /files/scan, /files/match-single, /publish/execute 를 호출합니다.
+단계별 소요 시간, 처리량, 항목당 Kitsu 요청 수를 출력하여 routers/files.py, routers/publish.py 의
+성능 변화를 오프라인에서 측정할 수 있습니다.
+
+사용법:
+    uv run backend/benchmarks/e2e_publish.py --files 10000 --concurrency 8 --latency-ms 5
+"""
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.abspath(os.path.join(BENCHMARK_DIR, '..'))
+
+def get_free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('localhost', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+def wait_until_up(session, url: str, timeout: float = 60.0):
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            if session.get(url, timeout=1).status_code < 500:
+                return
+        except Exception:
+            time.sleep(0.05)
+    raise TimeoutError(f"{url} did not come up within {timeout}s")
+
+def create_files(directory: str, files: int, versions: int, sequences: int, shots_per_sequence: int, file_size: int) -> int:
+    """mock 프로젝트의 샷 이름 규칙에 맞춰 기본 파일명 패턴으로 가상 렌더 파일을 생성"""
+    payload = b"\0" * file_size
+    created = 0
+    for sq in range(1, sequences + 1):
+        seq_dir = os.path.join(directory, f"SQ{sq:03d}")
+        os.makedirs(seq_dir, exist_ok=True)
+        for sh in range(1, shots_per_sequence + 1):
+            for version in range(1, versions + 1):
+                if created >= files:
+                    return created
+                filename = f"EP01_SQ{sq:03d}_SH{sh * 10:05d}_Comp_v{version:03d}.mov"
+                with open(os.path.join(seq_dir, filename), 'wb') as f:
+                    f.write(payload)
+                created += 1
+    return created
+
+class Phase:
+    def __init__(self, name: str, api, mock_url: str):
+        self.name = name
+        self.api = api
+        self.mock_url = mock_url
+        self.items = 0
+        self.errors = 0
+
+    def __enter__(self):
+        self.api.post(f"{self.mock_url}/mock/stats/reset")
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self.start
+        self.stats = self.api.get(f"{self.mock_url}/mock/stats").json()
+
+    def report(self) -> Dict[str, Any]:
+        requests_count = self.stats.get("requests", 0)
+        return {
+            "phase": self.name,
+            "items": self.items,
+            "errors": self.errors,
+            "wall_time_s": round(self.elapsed, 3),
+            "items_per_s": round(self.items / self.elapsed, 1) if self.elapsed > 0 else None,
+            "kitsu_requests": requests_count,
+            "kitsu_requests_per_item": round(requests_count / self.items, 2) if self.items else None,
+        }
+
+def run_parallel(worker, items, concurrency: int) -> List[Any]:
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(worker, items))
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scan/match/publish benchmark against a mock Kitsu")
+    parser.add_argument("--files", type=int, default=10000, help="number of render files to generate")
+    parser.add_argument("--versions", type=int, default=1, help="versions per shot (files are grouped by shot/task)")
+    parser.add_argument("--sequences", type=int, default=10)
+    parser.add_argument("--file-size", type=int, default=1024, help="bytes per generated file")
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel match/publish requests")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="mock Kitsu latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="mock Kitsu injected error rate")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    shots_per_sequence = math.ceil(args.files / args.versions / args.sequences)
+    workdir = tempfile.mkdtemp(prefix="kitsu_publisher_bench_")
+    render_dir = os.path.join(workdir, "renders")
+
+    # 사용자 설정(~/.kitsu_publisher_data)을 건드리지 않도록 임시 홈 디렉터리 사용
+    os.environ["HOME"] = workdir
+    os.environ["USERPROFILE"] = workdir
+    sys.path.insert(0, BACKEND_DIR)
+
+    import requests
+    import uvicorn
+    from services.scanner import group_latest_versions
+
+    mock_port = get_free_port()
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    mock_proc = subprocess.Popen(
+        [
+            sys.executable, os.path.join(BENCHMARK_DIR, "mock_kitsu.py"),
+            "--port", str(mock_port),
+            "--sequences", str(args.sequences),
+            "--shots", str(shots_per_sequence),
+            "--latency-ms", str(args.latency_ms),
+            "--error-rate", str(args.error_rate),
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+
+    try:
+        created = create_files(render_dir, args.files, args.versions, args.sequences, shots_per_sequence, args.file_size)
+
+        from main import app
+        api_port = get_free_port()
+        api_url = f"http://127.0.0.1:{api_port}"
+        server = uvicorn.Server(uvicorn.Config(app=app, host="127.0.0.1", port=api_port, log_level="error"))
+        threading.Thread(target=server.run, daemon=True).start()
+
+        api = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=args.concurrency)
+        api.mount("http://", adapter)
+        wait_until_up(api, f"{mock_url}/mock/stats")
+        wait_until_up(api, f"{api_url}/")
+
+        login = api.post(f"{api_url}/auth/login", json={"host": mock_url, "email": "bench@example.com", "password": "x"})
+        login.raise_for_status()
+        project_id = api.get(f"{api_url}/kitsu/projects").json()[0]["id"]
+        status_id = api.get(f"{api_url}/kitsu/task-status-types").json()[0]["id"]
+
+        phases = []
+
+        with Phase("scan", api, mock_url) as phase:
+            response = api.post(f"{api_url}/files/scan", json={"directory": render_dir, "project_id": project_id})
+            response.raise_for_status()
+            scanned = response.json()
+            phase.items = len(scanned)
+        phases.append(phase)
+
+        groups = group_latest_versions(scanned)
+
+        def match(group):
+            response = api.post(f"{api_url}/files/match-single", json={
+                "project_id": project_id,
+                "episode_name": group["episode_name"],
+                "sequence_name": group["sequence_name"],
+                "shot_name": group["shot_name"],
+                "task_name": group["task_name"],
+            })
+            return {**group, **response.json()} if response.ok else {**group, "task_id": None}
+
+        with Phase("match", api, mock_url) as phase:
+            matched = run_parallel(match, groups, args.concurrency)
+            phase.items = len(groups)
+            phase.errors = sum(1 for m in matched if not m.get("task_id"))
+        phases.append(phase)
+
+        to_publish = [
+            m for m in matched
+            if m.get("task_id") and (m.get("last_version") is None or (m["version"] or 0) > m["last_version"])
+        ]
+
+        def publish(item):
+            response = api.post(f"{api_url}/publish/execute", json={"items": [{
+                "file_path": item["file_path"],
+                "shot_id": item["shot_id"],
+                "task_id": item["task_id"],
+                "task_status_id": status_id,
+            }]})
+            return response.ok and response.json()[0]["status"] == "success"
+
+        with Phase("publish", api, mock_url) as phase:
+            published = run_parallel(publish, to_publish, args.concurrency)
+            phase.items = len(to_publish)
+            phase.errors = published.count(False)
+        phases.append(phase)
+
+        server.should_exit = True
+        total_time = sum(p.elapsed for p in phases)
+        total_requests = sum(p.stats.get("requests", 0) for p in phases)
+        report = {
+            "files": created,
+            "groups": len(groups),
+            "concurrency": args.concurrency,
+            "latency_ms": args.latency_ms,
+            "error_rate": args.error_rate,
+            "phases": [p.report() for p in phases],
+            "total_wall_time_s": round(total_time, 3),
+            "files_per_s": round(created / total_time, 1) if total_time > 0 else None,
+            "kitsu_requests_per_file": round(total_requests / created, 2) if created else None,
+        }
+
+        if args.json:
+            print(json.dumps(report, indent=2))
+            return
+
+        print(f"End-to-end benchmark: {created} files, {len(groups)} groups, concurrency {args.concurrency}, "
+              f"latency {args.latency_ms} ms, error rate {args.error_rate}")
+        for p in report["phases"]:
+            print(
+                f"{p['phase']:<8} {p['items']:>7} items | {p['wall_time_s']:>8.2f} s | "
+                f"{p['items_per_s'] or 0:>8.1f} items/s | {p['kitsu_requests']:>7} kitsu req "
+                f"({p['kitsu_requests_per_item'] or 0} / item) | {p['errors']} errors"
+            )
+        print(f"total    {report['total_wall_time_s']:.2f} s | {report['files_per_s']} files/s | "
+              f"{report['kitsu_requests_per_file']} kitsu requests / file")
+    finally:
+        mock_proc.terminate()
+        try:
+            mock_proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            mock_proc.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,355 @@
+"""
+로컬 Kitsu 대체(mock) API 서버.
+
+이 앱에서 gazu가 호출하는 엔드포인트(로그인, 프로젝트, 시퀀스, 샷, 태스크/태스크 타입, 상태, 코멘트,
+프리뷰 업로드)만 구현하며, 수천 개의 샷을 가진 가상 프로젝트를 생성합니다.
+응답 지연과 오류 주입을 설정할 수 있어 운영 Kitsu 없이 부하 테스트에 사용할 수 있습니다.
+
+사용법:
+    uv run backend/benchmarks/mock_kitsu.py --port 8100 --sequences 10 --shots 1000 --latency-ms 20
+    # 앱에서 호스트를 http://127.0.0.1:8100 으로, 아무 이메일/비밀번호로 로그인
+"""
+import json
+import time
+import uuid
+import base64
+import random
+import asyncio
+import argparse
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import JSONResponse
+
+TASK_TYPES = ["Animation", "Lighting", "Compositing"]
+TASK_STATUSES = [
+    ("Todo", "todo"),
+    ("Work In Progress", "wip"),
+    ("Waiting For Approval", "wfa"),
+    ("Done", "done"),
+]
+
+@dataclass
+class MockKitsuOptions:
+    episodes: int = 1
+    sequences: int = 10
+    shots: int = 1000  # 시퀀스당 샷 수
+    latency_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    token_ttl: float = 3600.0
+    max_existing_revision: int = 2
+    seed: int = 0
+
+def make_id(*parts) -> str:
+    """gazu는 UUID 형식의 ID만 허용하므로 이름으로부터 결정적인 UUID를 생성"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "mock-kitsu/" + "/".join(str(p) for p in parts)))
+
+def make_token(kind: str, ttl: float) -> str:
+    """서명 없는 가짜 JWT (gazu/백엔드가 exp 클레임을 읽을 수 있도록 형식만 맞춤)"""
+    def encode(data: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    now = time.time()
+    payload = {"type": kind, "iat": int(now), "exp": int(now + ttl), "jti": uuid.uuid4().hex}
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(payload)}.mock"
+
+def read_token_exp(token: str) -> Optional[float]:
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, ValueError):
+        return None
+
+class MockKitsuData:
+    """가상 프로젝트 데이터와 퍼블리시 결과(코멘트, 프리뷰)를 메모리에 보관"""
+
+    def __init__(self, options: MockKitsuOptions):
+        rng = random.Random(options.seed)
+        self.lock = threading.Lock()
+        self.user = {"id": make_id("user"), "full_name": "Mock User", "email": "mock@example.com", "role": "admin"}
+        self.project = {"id": make_id("project"), "name": "Mock Project", "project_status_name": "Open"}
+        self.task_statuses = [
+            {"id": make_id("status", short), "name": name, "short_name": short} for name, short in TASK_STATUSES
+        ]
+        self.task_types = [{"id": make_id("task-type", name), "name": name} for name in TASK_TYPES]
+        self.sequences: List[Dict[str, Any]] = []
+        self.shots_by_sequence: Dict[str, List[Dict[str, Any]]] = {}
+        self.tasks_by_shot: Dict[str, List[Dict[str, Any]]] = {}
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.previews_by_task: Dict[str, List[Dict[str, Any]]] = {}
+        self.comments: Dict[str, Dict[str, Any]] = {}
+        self.preview_files: Dict[str, Dict[str, Any]] = {}
+
+        for ep in range(1, options.episodes + 1):
+            for sq in range(1, options.sequences + 1):
+                sequence = {"id": make_id("sequence", ep, sq), "name": f"EP{ep:02d}_SQ{sq:03d}", "type": "Sequence"}
+                self.sequences.append(sequence)
+                shots = []
+                for sh in range(1, options.shots + 1):
+                    shot = {
+                        "id": make_id("shot", ep, sq, sh),
+                        "name": f"SH{sh * 10:05d}",
+                        "parent_id": sequence["id"],
+                        "sequence_id": sequence["id"],
+                        "sequence_name": sequence["name"],
+                        "type": "Shot",
+                    }
+                    shots.append(shot)
+                    tasks = []
+                    for task_type in self.task_types:
+                        task = {
+                            "id": make_id("task", shot["id"], task_type["name"]),
+                            "task_type_id": task_type["id"],
+                            "task_type_name": task_type["name"],
+                            "entity_id": shot["id"],
+                            "project_id": self.project["id"],
+                            "last_preview_file_id": None,
+                        }
+                        tasks.append(task)
+                        self.tasks[task["id"]] = task
+                        revision_count = rng.randint(0, options.max_existing_revision)
+                        self.previews_by_task[task["id"]] = [
+                            {"id": make_id("preview", task["id"], r), "revision": r, "task_id": task["id"]}
+                            for r in range(1, revision_count + 1)
+                        ]
+                        if self.previews_by_task[task["id"]]:
+                            task["last_preview_file_id"] = self.previews_by_task[task["id"]][-1]["id"]
+                    self.tasks_by_shot[shot["id"]] = tasks
+                self.shots_by_sequence[sequence["id"]] = shots
+
+    @property
+    def all_shots(self):
+        for sequence in self.sequences:
+            for shot in self.shots_by_sequence[sequence["id"]]:
+                yield sequence, shot
+
+def create_app(options: Optional[MockKitsuOptions] = None) -> FastAPI:
+    options = options or MockKitsuOptions()
+    data = MockKitsuData(options)
+    rng = random.Random(options.seed + 1)
+    stats: Counter = Counter()
+
+    app = FastAPI(title="Mock Kitsu API")
+    app.state.data = data
+    app.state.stats = stats
+    app.state.options = options
+
+    @app.middleware("http")
+    async def simulate_network(request: Request, call_next):
+        if request.url.path.startswith("/mock/"):
+            return await call_next(request)
+        stats["requests"] += 1
+        if options.latency_ms > 0:
+            await asyncio.sleep(options.latency_ms / 1000.0)
+        if options.error_rate > 0 and rng.random() < options.error_rate:
+            stats["injected_errors"] += 1
+            return JSONResponse(status_code=options.error_status, content={"message": "Injected error"})
+        response = await call_next(request)
+        route = request.scope.get("route")
+        stats[f"{request.method} {getattr(route, 'path', request.url.path)}"] += 1
+        return response
+
+    def require_auth(request: Request):
+        header = request.headers.get("authorization", "")
+        if not header.startswith("Bearer "):
+            raise HTTPException(status_code=401, detail="Missing token")
+        exp = read_token_exp(header[len("Bearer "):])
+        if exp is None:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        if exp < time.time():
+            stats["expired_tokens"] += 1
+            # Kitsu(flask-jwt-extended)와 같은 메시지로 응답해야 gazu가 만료로 인식함
+            raise HTTPException(status_code=401, detail="Signature has expired")
+
+    @app.exception_handler(HTTPException)
+    async def http_exception_handler(request: Request, exc: HTTPException):
+        return JSONResponse(status_code=exc.status_code, content={"message": exc.detail})
+
+    def get_or_404(mapping: Dict[str, Any], key: str):
+        if key not in mapping:
+            raise HTTPException(status_code=404, detail="Not found")
+        return mapping[key]
+
+    # 인증
+    @app.post("/api/auth/login")
+    async def login():
+        return {
+            "login": True,
+            "user": data.user,
+            "access_token": make_token("access", options.token_ttl),
+            "refresh_token": make_token("refresh", options.token_ttl * 24),
+        }
+
+    @app.get("/api/auth/authenticated")
+    def authenticated(request: Request):
+        require_auth(request)
+        return {"authenticated": True, "user": data.user}
+
+    @app.get("/api/auth/refresh-token")
+    def refresh_token(request: Request):
+        require_auth(request)
+        return {"access_token": make_token("access", options.token_ttl)}
+
+    # 조회
+    @app.get("/api/data/projects/open")
+    def open_projects(request: Request):
+        require_auth(request)
+        return [data.project]
+
+    @app.get("/api/data/projects/{project_id}")
+    def get_project(project_id: str, request: Request):
+        require_auth(request)
+        if project_id != data.project["id"]:
+            raise HTTPException(status_code=404, detail="Not found")
+        return data.project
+
+    @app.get("/api/data/projects/{project_id}/sequences")
+    def project_sequences(project_id: str, request: Request):
+        require_auth(request)
+        return data.sequences if project_id == data.project["id"] else []
+
+    @app.get("/api/data/projects/{project_id}/shots")
+    def project_shots(project_id: str, request: Request):
+        require_auth(request)
+        if project_id != data.project["id"]:
+            return []
+        return [shot for _, shot in data.all_shots]
+
+    @app.get("/api/data/projects/{project_id}/tasks")
+    def project_tasks(project_id: str, request: Request):
+        require_auth(request)
+        if project_id != data.project["id"]:
+            return []
+        with data.lock:
+            return [dict(task) for task in data.tasks.values()]
+
+    @app.get("/api/data/task-types")
+    def task_types(request: Request):
+        require_auth(request)
+        return data.task_types
+
+    @app.get("/api/data/sequences/{sequence_id}/shots")
+    def sequence_shots(sequence_id: str, request: Request):
+        require_auth(request)
+        return data.shots_by_sequence.get(sequence_id, [])
+
+    @app.get("/api/data/shots/{shot_id}/tasks")
+    def shot_tasks(shot_id: str, request: Request):
+        require_auth(request)
+        return data.tasks_by_shot.get(shot_id, [])
+
+    @app.get("/api/data/task-status")
+    def task_statuses(request: Request):
+        require_auth(request)
+        return data.task_statuses
+
+    @app.get("/api/data/task-status/{status_id}")
+    def task_status(status_id: str, request: Request):
+        require_auth(request)
+        return get_or_404({s["id"]: s for s in data.task_statuses}, status_id)
+
+    @app.get("/api/data/tasks/{task_id}/full")
+    def task_full(task_id: str, request: Request):
+        require_auth(request)
+        return get_or_404(data.tasks, task_id)
+
+    @app.get("/api/data/preview-files")
+    def preview_files(request: Request, task_id: Optional[str] = None):
+        require_auth(request)
+        with data.lock:
+            return list(data.previews_by_task.get(task_id, []))
+
+    # 퍼블리시
+    @app.post("/api/actions/tasks/{task_id}/comment")
+    async def add_comment(task_id: str, request: Request):
+        require_auth(request)
+        get_or_404(data.tasks, task_id)
+        payload = await request.json()
+        comment = {
+            "id": str(uuid.uuid4()),
+            "object_id": task_id,
+            "task_status_id": payload.get("task_status_id"),
+            "text": payload.get("comment", ""),
+        }
+        with data.lock:
+            data.comments[comment["id"]] = comment
+        return comment
+
+    @app.post("/api/actions/tasks/{task_id}/comments/{comment_id}/add-preview")
+    async def add_preview(task_id: str, comment_id: str, request: Request):
+        require_auth(request)
+        get_or_404(data.tasks, task_id)
+        with data.lock:
+            get_or_404(data.comments, comment_id)
+            previews = data.previews_by_task.setdefault(task_id, [])
+            revision = max((p["revision"] for p in previews), default=0) + 1
+            preview = {"id": str(uuid.uuid4()), "revision": revision, "task_id": task_id, "status": "processing"}
+            previews.append(preview)
+            data.preview_files[preview["id"]] = preview
+            data.tasks[task_id]["last_preview_file_id"] = preview["id"]
+        return preview
+
+    @app.post("/api/pictures/preview-files/{preview_id}")
+    async def upload_preview(preview_id: str, request: Request):
+        require_auth(request)
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+        stats["uploaded_bytes"] += size
+        with data.lock:
+            preview = get_or_404(data.preview_files, preview_id)
+            preview["status"] = "ready"
+            return dict(preview)
+
+    # 벤치마크용 통계
+    @app.get("/mock/stats")
+    def get_stats():
+        return dict(stats)
+
+    @app.post("/mock/stats/reset")
+    def reset_stats():
+        stats.clear()
+        return {"status": "reset"}
+
+    return app
+
+def add_options_arguments(parser: argparse.ArgumentParser):
+    defaults = MockKitsuOptions()
+    parser.add_argument("--episodes", type=int, default=defaults.episodes)
+    parser.add_argument("--sequences", type=int, default=defaults.sequences, help="sequences per episode")
+    parser.add_argument("--shots", type=int, default=defaults.shots, help="shots per sequence")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="delay added to every request")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="fraction of requests answered with --error-status")
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--token-ttl", type=float, default=defaults.token_ttl, help="access token lifetime in seconds")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+def options_from_args(args) -> MockKitsuOptions:
+    return MockKitsuOptions(
+        episodes=args.episodes,
+        sequences=args.sequences,
+        shots=args.shots,
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        token_ttl=args.token_ttl,
+        seed=args.seed,
+    )
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a local mock Kitsu API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    add_options_arguments(parser)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(options_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+앱 시작 성능 측정 스크립트.
+
+- import 시간: 새 파이썬 프로세스에서 `main` 모듈을 import 하는 데 걸린 시간
+- 첫 응답 시간: uvicorn 서버 프로세스를 띄운 뒤 `/` 요청이 처음 성공하기까지 걸린 시간
+
+사용법:
+    uv run backend/benchmarks/startup.py --runs 5
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import statistics
+import subprocess
+import urllib.request
+import urllib.error
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import main; "
+    "print(time.perf_counter() - t)"
+)
+
+def get_free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('localhost', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+def measure_import() -> float:
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SNIPPET],
+        cwd=BACKEND_DIR,
+        stderr=subprocess.DEVNULL,
+    )
+    return float(output.decode().strip().splitlines()[-1])
+
+def measure_first_response(timeout: float = 30.0) -> float:
+    port = get_free_port()
+    url = f"http://127.0.0.1:{port}/"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "error"],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError("Server exited before responding")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.01)
+        raise TimeoutError(f"No response from {url} within {timeout}s")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+def summarize(label: str, samples):
+    print(
+        f"{label:<22} min {min(samples) * 1000:8.1f} ms | "
+        f"median {statistics.median(samples) * 1000:8.1f} ms | "
+        f"max {max(samples) * 1000:8.1f} ms"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Kitsu Publisher backend startup time")
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts to measure")
+    args = parser.parse_args()
+
+    import_times = [measure_import() for _ in range(args.runs)]
+    response_times = [measure_first_response() for _ in range(args.runs)]
+
+    print(f"Startup benchmark ({args.runs} runs)")
+    summarize("import main", import_times)
+    summarize("time to first response", response_times)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+Kitsu Publisher 헤드리스 CLI.
+
+렌더팜 후처리 작업 등에서 UI나 API 서버 없이 스캔 -> 매칭 -> 퍼블리시를 수행합니다.
+결과는 한 줄에 하나씩 JSON(NDJSON)으로 표준 출력에 기록되고, 로그는 표준 에러로 나갑니다.
+
+사용 예:
+    uv run backend/cli.py publish --dir /renders/ep01 --project "My Project" --status WFA --jobs 4
+    uv run backend/cli.py publish --dir /renders/ep01 --project "My Project" --status WFA --dry-run
+
+종료 코드: 0 성공, 1 일부 항목 실패(오류/미매칭), 2 설정/인증 오류
+"""
+import os
+import sys
+import json
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Iterable, Iterator, Callable, Optional
+
+# Add current directory to sys.path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from dependencies import config_manager, kitsu_clients
+from services.kitsu_client import KitsuClient
+from services.parser import ParseCache
+from services.scanner import scan_files, group_latest_versions
+from services.matcher import KitsuLookupCache, match_shot
+from services.publisher import publish_item
+
+logger = logging.getLogger("kitsu_publisher")
+
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_SETUP_ERROR = 2
+
+# 결과 상태 중 실패로 간주하는 값
+FAILED_STATUSES = {"error", "unmatched"}
+
+class SetupError(Exception):
+    pass
+
+def emit(record: Dict[str, Any], stream=None):
+    stream = stream or sys.stdout
+    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    stream.flush()
+
+def connect(args) -> KitsuClient:
+    """명령행/환경 변수의 계정 정보로 로그인하거나, 데스크톱 앱에 저장된 세션을 사용합니다."""
+    host = args.host or os.environ.get("KITSU_HOST")
+    email = args.email or os.environ.get("KITSU_EMAIL")
+    password = os.environ.get("KITSU_PASSWORD")
+    try:
+        if host and email and password:
+            logger.info(f"Logging in to {host} as {email}")
+            return kitsu_clients.login(host, email, password)
+
+        session = config_manager.get("session")
+        if session and "host" in session and "tokens" in session:
+            logger.info(f"Using saved session for host: {session['host']}")
+            return kitsu_clients.restore(session["host"], session["tokens"])
+    except Exception as e:
+        raise SetupError(f"Kitsu authentication failed: {e}")
+    raise SetupError("No Kitsu credentials: set KITSU_HOST/KITSU_EMAIL/KITSU_PASSWORD or log in with the desktop app")
+
+def resolve_by_id_or_name(items, value: str, label: str, name_keys=("name",)) -> Dict[str, Any]:
+    for item in items:
+        if item["id"] == value:
+            return item
+    lowered = value.lower()
+    for item in items:
+        if any((item.get(key) or "").lower() == lowered for key in name_keys):
+            return item
+    raise SetupError(f"{label} not found: {value}")
+
+def run_pipeline(items: Iterable[Dict[str, Any]], worker: Callable[[Dict[str, Any]], Dict[str, Any]], jobs: int) -> Iterator[Dict[str, Any]]:
+    """
+    항목을 워커 풀로 처리하며 완료되는 순서대로 결과를 내보냅니다.
+    대기 중인 작업 수를 제한하여 항목이 많아도 메모리 사용량이 일정하게 유지됩니다.
+    """
+    max_pending = max(1, jobs) * 2
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        pending = set()
+        for item in items:
+            pending.add(pool.submit(worker, item))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+def make_publish_worker(client: KitsuClient, project_id: str, status_id: str, comment: Optional[str], dry_run: bool, force: bool):
+    lookup_cache = KitsuLookupCache()
+
+    def process(group: Dict[str, Any]) -> Dict[str, Any]:
+        record = {
+            "type": "item",
+            "file_path": group["file_path"],
+            "filename": group["filename"],
+            "sequence_name": group["sequence_name"],
+            "shot_name": group["shot_name"],
+            "task_name": group["task_name"],
+            "version": group["version"],
+            "skipped_versions": [v["file_path"] for v in group["all_versions"][1:]],
+        }
+        if not group["shot_name"]:
+            return {**record, "status": "unmatched", "message": "Filename does not match the current pattern"}
+
+        try:
+            match = match_shot(client, project_id, group["sequence_name"], group["shot_name"], group["task_name"], cache=lookup_cache)
+        except Exception as e:
+            return {**record, "status": "error", "message": f"Match failed: {e}"}
+
+        record.update(shot_id=match["shot_id"], task_id=match["task_id"], last_version=match["last_version"])
+        if not match["task_id"]:
+            return {**record, "status": "unmatched", "message": f"No Kitsu match ({match['match_status']})"}
+        if match["error"]:
+            # 마지막 버전을 모르면 중복 업로드가 될 수 있으므로 퍼블리쉬하지 않음
+            return {**record, "status": "error", "message": match["error"]}
+
+        is_published = match["last_version"] is not None and (group["version"] or 0) <= match["last_version"]
+        if is_published and not force:
+            return {**record, "status": "skipped", "message": "Already published"}
+        if dry_run:
+            return {**record, "status": "planned"}
+
+        result = publish_item(client, group["file_path"], match["task_id"], status_id, comment)
+        if result["status"] == "success":
+            return {**record, "status": "published"}
+        return {**record, "status": "error", "message": result.get("message")}
+
+    return process
+
+def cmd_publish(args) -> int:
+    if not os.path.isdir(args.dir):
+        raise SetupError(f"Invalid directory path: {args.dir}")
+
+    client = connect(args)
+    project = resolve_by_id_or_name(client.all_open_projects(), args.project, "Project")
+    status = resolve_by_id_or_name(client.all_task_statuses(), args.status, "Task status", ("short_name", "name"))
+    logger.info(f"Project: {project['name']}, status: {status['name']}")
+
+    project_config = config_manager.get_project_config(project["id"])
+    items = scan_files(args.dir, project["id"], project_config, config_manager.version, ParseCache())
+    groups = group_latest_versions(items)
+    logger.info(f"Found {len(groups)} shot/task groups in {args.dir}")
+
+    worker = make_publish_worker(client, project["id"], status["id"], args.comment, args.dry_run, args.force)
+    counts: Dict[str, int] = {}
+    for record in run_pipeline(groups, worker, args.jobs):
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+        emit(record)
+
+    failed = sum(counts.get(s, 0) for s in FAILED_STATUSES)
+    emit({"type": "summary", "dry_run": args.dry_run, "total": len(groups), "counts": counts, "failed": failed})
+    return EXIT_FAILURES if failed else EXIT_OK
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="kitsu-publisher", description="Headless Kitsu batch publisher")
+    parser.add_argument("-v", "--verbose", action="store_true", help="enable debug logging")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    publish = subparsers.add_parser("publish", help="scan a directory, match files to Kitsu tasks and publish them")
+    publish.add_argument("--dir", required=True, help="directory to scan recursively for .mov/.mp4 files")
+    publish.add_argument("--project", required=True, help="Kitsu project id or name")
+    publish.add_argument("--status", required=True, help="task status id, short name or name to set on publish")
+    publish.add_argument("--comment", default=None, help="comment text for each published version")
+    publish.add_argument("--jobs", type=int, default=4, help="number of parallel match/publish workers (default: 4)")
+    publish.add_argument("--dry-run", action="store_true", help="only report what would be published")
+    publish.add_argument("--force", action="store_true", help="publish even if Kitsu already has this version")
+    publish.add_argument("--host", default=None, help="Kitsu host (or KITSU_HOST); password is read from KITSU_PASSWORD")
+    publish.add_argument("--email", default=None, help="Kitsu login email (or KITSU_EMAIL)")
+    publish.set_defaults(func=cmd_publish)
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        stream=sys.stderr,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+    )
+    try:
+        return args.func(args)
+    except SetupError as e:
+        logger.error(str(e))
+        emit({"type": "error", "message": str(e)})
+        return EXIT_SETUP_ERROR
+    finally:
+        config_manager.flush()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,62 @@
 import os
+import copy
 import json
+import atexit
 import logging
-from typing import Dict, Any
+import tempfile
+import threading
+from typing import Dict, Any, Iterable, Optional, Tuple
 
 logger = logging.getLogger("kitsu_publisher")
 
+# 프로젝트별로 덮어쓸 수 있는 설정 키
+PROJECT_CONFIG_KEYS = (
+    "default_task_name",
+    "filename_pattern",
+    "sequence_name_template",
+    "shot_name_template",
+)
+# 변경 시 파서/스캔 캐시를 무효화해야 하는 설정 키
+PARSE_CONFIG_KEYS = frozenset(PROJECT_CONFIG_KEYS) | {"project_settings"}
+
+# 저장 요청이 연속으로 들어올 때 마지막 요청 후 이 시간(초)만큼 기다렸다가 한 번만 기록
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 class ConfigManager:
-    def __init__(self):
+    """
+    메모리에 설정을 보관하고 파일에는 지연(write-behind) 저장하는 설정 저장소.
+
+    - 기본값은 한 번만 생성해 재사용합니다.
+    - 파일명 파싱에 영향을 주는 설정(패턴/템플릿, 프로젝트별 설정)이 바뀔 때만 `version`이
+      증가하며, 프로젝트별 병합 결과나 파서/스캔 캐시는 이 값으로 만료 여부를 판단합니다.
+      (last_directory, session 등은 캐시를 비우지 않음)
+    - 파일 기록은 디바운스되며 임시 파일에 쓴 뒤 rename 하여 원자적으로 교체합니다.
+    - pywebview API 스레드와 FastAPI 워커 스레드에서 동시에 접근해도 안전합니다.
+    """
+
+    def __init__(self, save_delay: float = SAVE_DEBOUNCE_SECONDS):
         # 설정 파일 경로: ~/.kitsu_publisher_data/config.json
         self.config_dir = os.path.join(os.path.expanduser('~'), '.kitsu_publisher_data')
         self.config_file = os.path.join(self.config_dir, 'config.json')
+        self.save_delay = save_delay
+
+        self._lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._version = 0
+        self._project_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._defaults = self._build_default_config()
+
         self.config = {}
         self.config = self.load_config()
+        atexit.register(self.flush)
 
-    def get_default_config(self) -> Dict[str, Any]:
+    @property
+    def version(self) -> int:
+        """파싱 관련 설정이 바뀔 때마다 증가하는 카운터"""
+        return self._version
+
+    def _build_default_config(self) -> Dict[str, Any]:
         return {
             "default_task_name": "Compositing",
             # 기본 패턴: 시퀀스_샷_태스크_v버전
@@ -29,43 +72,96 @@ class ConfigManager:
             "project_settings": {}  # 프로젝트별 설정을 저장할 딕셔너리
         }
 
+    def get_default_config(self) -> Dict[str, Any]:
+        # 호출 측에서 수정해도 원본 기본값이 오염되지 않도록 복사본을 반환
+        return copy.deepcopy(self._defaults)
+
     def load_config(self) -> Dict[str, Any]:
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir)
-        
+
         if not os.path.exists(self.config_file):
             default_config = self.get_default_config()
-            self.save_config(default_config)
+            with self._lock:
+                self.config = default_config
+                self._dirty = True
+            self.flush()
             return default_config
 
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 user_config = json.load(f)
                 # 누락된 키가 있으면 기본값으로 채움
-                default = self.get_default_config()
-                for key, value in default.items():
+                for key, value in self._defaults.items():
                     if key not in user_config:
-                        user_config[key] = value
+                        user_config[key] = copy.deepcopy(value)
                 return user_config
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             return self.get_default_config()
 
-    def save_config(self, new_config: Dict[str, Any]):
+    def _mark_changed(self, keys: Iterable[str]):
+        # 호출 측에서 self._lock을 잡고 있어야 함
+        if any(key in PARSE_CONFIG_KEYS for key in keys):
+            self._version += 1
+            self._project_cache.clear()
+        self._dirty = True
+        self._schedule_save()
+
+    def _schedule_save(self):
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.save_delay, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def flush(self):
+        """대기 중인 변경 사항을 즉시 파일에 기록합니다."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            data = json.dumps(self.config, indent=4)
+            self._dirty = False
+
         try:
-            # self.config를 먼저 업데이트
-            self.config.update(new_config)
-            
-            # 파일에는 전체 config를 씀
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
+            os.makedirs(self.config_dir, exist_ok=True)
+            # 같은 디렉터리의 임시 파일에 쓴 뒤 교체해야 중간에 종료되어도 파일이 깨지지 않음
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix='.config.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_file)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             logger.info("Configuration saved.")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
+            with self._lock:
+                self._dirty = True
+
+    def save_config(self, new_config: Dict[str, Any]):
+        with self._lock:
+            self.config.update(new_config)
+            self._mark_changed(new_config.keys())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """응답 직렬화 등에 사용할 수 있는 설정 전체의 복사본"""
+        with self._lock:
+            return copy.deepcopy(self.config)
 
     def get(self, key: str):
         # self.config에서 먼저 찾고, 없으면 기본값에서 찾음
-        return self.config.get(key, self.get_default_config().get(key))
+        with self._lock:
+            if key in self.config:
+                return self.config[key]
+        return copy.deepcopy(self._defaults.get(key))
 
     def set(self, key: str, value: Any):
         self.save_config({key: value})
@@ -73,24 +169,30 @@ class ConfigManager:
     def get_project_config(self, project_id: str) -> Dict[str, Any]:
         """
         특정 프로젝트의 설정을 가져옵니다. 프로젝트 설정이 없으면 전역 설정을 기본값으로 반환합니다.
+        병합 결과는 설정 버전이 바뀔 때까지 캐시됩니다.
         """
-        project_settings = self.config.get("project_settings", {})
-        specific_config = project_settings.get(project_id, {})
-        
-        # 병합된 설정 반환
-        result = {
-            "default_task_name": self.get("default_task_name"),
-            "filename_pattern": self.get("filename_pattern"),
-            "sequence_name_template": self.get("sequence_name_template"),
-            "shot_name_template": self.get("shot_name_template")
-        }
-        result.update(specific_config)
-        return result
+        with self._lock:
+            cached = self._project_cache.get(project_id)
+            if cached is not None and cached[0] == self._version:
+                return dict(cached[1])
+
+            result = {key: self.config.get(key, self._defaults.get(key)) for key in PROJECT_CONFIG_KEYS}
+            specific_config = self.config.get("project_settings", {}).get(project_id, {})
+            result.update(specific_config)
+
+            self._project_cache[project_id] = (self._version, result)
+            return dict(result)
 
     def save_project_config(self, project_id: str, new_project_config: Dict[str, Any]):
         """
         특정 프로젝트의 설정을 저장합니다.
         """
-        project_settings = self.config.get("project_settings", {})
-        project_settings[project_id] = new_project_config
-        self.save_config({"project_settings": project_settings})
+        with self._lock:
+            project_settings = dict(self.config.get("project_settings", {}))
+            project_settings[project_id] = dict(new_project_config)
+            self.config["project_settings"] = project_settings
+            self._mark_changed(("project_settings",))
+
+# 앱 전체에서 공유하는 설정 저장소
+# (desktop.py는 FastAPI 등을 불러오지 않도록 dependencies 대신 여기서 직접 import)
+config_manager = ConfigManager()
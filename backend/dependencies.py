@@ -1,12 +1,32 @@
 import logging
 import asyncio
-import gazu
+import threading
+from typing import Optional
+from fastapi import Header, HTTPException
 from updater import Updater
-from config import ConfigManager
+from config import config_manager
+from services.kitsu_client import KitsuClient, KitsuClientRegistry, normalize_host
+from services.planner import ProjectStateCache
+
+def persist_refreshed_tokens(client: KitsuClient):
+    """갱신된 토큰이 저장된 세션의 것이면 config에도 반영 (재시작 시 재로그인 방지)"""
+    session = config_manager.get("session")
+    if not session or "host" not in session or "tokens" not in session:
+        return
+    if normalize_host(session["host"]) != client.host:
+        return
+    saved_user = (session["tokens"] or {}).get("user") or {}
+    if client.user and saved_user.get("id") not in (None, client.user.get("id")):
+        return
+    tokens = dict(session["tokens"])
+    tokens["access_token"] = client.raw.access_token
+    tokens["refresh_token"] = client.raw.refresh_token or tokens.get("refresh_token")
+    config_manager.set("session", {**session, "tokens": tokens})
 
 # Global Instances
 updater = Updater()
-config_manager = ConfigManager()
+kitsu_clients = KitsuClientRegistry(on_tokens_refreshed=persist_refreshed_tokens)
+project_states = ProjectStateCache()
 
 # Logging Setup
 log_queue = asyncio.Queue()
@@ -32,18 +52,56 @@ def setup_logging():
     logger.addHandler(queue_handler)
     logging.getLogger().addHandler(queue_handler)
 
-def init_gazu():
-    """Initialize gazu with saved session if available"""
-    session = config_manager.get("session")
-    if session and "host" in session and "tokens" in session:
+# 저장된 세션을 동시에 여러 번 복원하지 않도록 보호
+_restore_lock = threading.Lock()
+
+def restore_saved_session() -> Optional[KitsuClient]:
+    """
+    config에 저장된 세션을 기본 Kitsu 클라이언트로 등록합니다. (이미 있으면 그대로 반환)
+    네트워크 요청 없이 토큰만 설정하므로 오프라인 상태에서도 세션이 유지됩니다.
+    """
+    with _restore_lock:
+        client = kitsu_clients.get()
+        if client is not None:
+            return client
+        session = config_manager.get("session")
+        if not session or "host" not in session or "tokens" not in session:
+            return None
         try:
-            host = session["host"]
-            tokens = session["tokens"]
-            logger.info(f"Restoring Kitsu session for host: {host}")
-            gazu.set_host(host)
-            gazu.client.set_tokens(tokens)
+            logger.info(f"Restoring Kitsu session for host: {session['host']}")
+            return kitsu_clients.restore(session["host"], session["tokens"], verify=False)
         except Exception as e:
             logger.error(f"Failed to restore session: {e}")
+            return None
+
+def init_gazu():
+    """gazu를 미리 import 하고 저장된 세션을 기본 Kitsu 클라이언트로 복원"""
+    restore_saved_session()
+
+def get_kitsu_client(x_kitsu_session: Optional[str] = Header(default=None)) -> KitsuClient:
+    """
+    요청의 X-Kitsu-Session 헤더로 세션을 선택합니다.
+    헤더가 없으면 가장 최근에 로그인/복원된 세션을 사용합니다.
+    아직 등록된 세션이 없으면 (앱 시작 직후 등) 저장된 세션을 바로 복원하여 사용합니다.
+    """
+    client = kitsu_clients.get(x_kitsu_session)
+    if client is None:
+        restored = restore_saved_session()
+        if restored is not None and x_kitsu_session in (None, restored.session_key):
+            client = restored
+    if client is None:
+        raise HTTPException(status_code=401, detail="Not logged in to Kitsu")
+    return client
+
+def start_background_init():
+    """
+    서버 시작 직후 무거운 초기화 작업(gazu import 및 저장된 세션 복원, 토큰 갱신, 업데이트 확인)을
+    백그라운드 스레드에서 수행하여 첫 응답이 지연되지 않도록 합니다.
+    """
+    threading.Thread(target=init_gazu, name="gazu-init", daemon=True).start()
+    kitsu_clients.start_refresher()
+    threading.Thread(target=updater.get_update_info, name="update-check", daemon=True).start()
 
-# Initialize
-init_gazu()
+def stop_background_tasks():
+    """서버 종료 시 토큰 갱신 스레드 정지"""
+    kitsu_clients.stop_refresher()
@@ -1,19 +1,18 @@
 import sys
 import os
+import time
 import threading
 import socket
 import webview
-from fastapi.staticfiles import StaticFiles
-from uvicorn import Config, Server
 
 # Add current directory to sys.path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-from main import app
-from dependencies import config_manager
+from config import config_manager
 
-# config_manager is imported from dependencies
+# FastAPI 앱(main)과 라우터, gazu 등은 서버 스레드에서 처음 필요할 때 import 하여
+# 창이 뜨는 시점을 앞당깁니다.
 
 class Api:
     def __init__(self):
@@ -60,7 +59,36 @@ def get_free_port():
     sock.close()
     return port
 
+# 서버가 준비될 때까지 창에 보여줄 로딩 화면
+STATUS_HTML = """<!DOCTYPE html>
+<html><body style="margin:0;height:100vh;display:flex;align-items:center;justify-content:center;
+background:#020617;color:#94a3b8;font-family:sans-serif;font-size:14px">{message}</body></html>"""
+LOADING_HTML = STATUS_HTML.format(message="Loading Kitsu Publisher...")
+SERVER_START_TIMEOUT = 60
+
+def wait_for_server(port, server_thread, timeout=SERVER_START_TIMEOUT):
+    """서버 포트가 연결을 받을 때까지 대기 (서버 스레드가 먼저 종료되면 실패)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and server_thread.is_alive():
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+def load_app_when_ready(window, port, server_thread):
+    # 창은 로딩 화면으로 먼저 띄우고, 서버가 실제로 요청을 받을 수 있을 때 앱 주소로 이동
+    if wait_for_server(port, server_thread):
+        window.load_url(f'http://127.0.0.1:{port}')
+    else:
+        window.load_html(STATUS_HTML.format(message="Failed to start the Kitsu Publisher server."))
+
 def start_server(port):
+    from uvicorn import Config, Server
+    from main import app
+    from services.static_assets import PrecompressedStaticFiles
+
     # Determine the base directory
     if getattr(sys, 'frozen', False):
         # Running as compiled PyInstaller executable
@@ -81,8 +109,8 @@ def start_server(port):
     app.router.routes = [route for route in app.router.routes if getattr(route, "path", "") != "/"]
 
     # Mount static files
-    # 'html=True' allows serving index.html when requesting /
-    app.mount("/", StaticFiles(directory=frontend_build_dir, html=True), name="static")
+    # 빌드 결과물을 메모리에 올리고 압축본/ETag를 미리 계산해 둠 (index.html은 / 요청에 응답)
+    app.mount("/", PrecompressedStaticFiles(directory=frontend_build_dir), name="static")
 
     # Configure and run server
     # We use uvicorn directly instead of uvicorn.run to have better control (though run is fine too)
@@ -105,8 +133,8 @@ if __name__ == '__main__':
 
     api = Api()
     # Create and start the webview window
-    window = webview.create_window('Kitsu Publisher', f'http://127.0.0.1:{port}', width=1280, height=800, resizable=True, js_api=api)
+    window = webview.create_window('Kitsu Publisher', html=LOADING_HTML, width=1280, height=800, resizable=True, js_api=api)
     api.set_window(window)
     
     # Enable persistence by specifying storage_path and disabling private_mode
-    webview.start(private_mode=False, storage_path=storage_path)
+    webview.start(load_app_when_ready, (window, port, t), private_mode=False, storage_path=storage_path)
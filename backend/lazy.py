@@ -0,0 +1,23 @@
+import importlib
+import threading
+
+class LazyModule:
+    """
+    처음 속성에 접근할 때 실제 모듈을 import 하는 프록시.
+    gazu 처럼 import 비용이 큰 모듈을 앱 시작 시점에 불러오지 않기 위해 사용합니다.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
@@ -3,7 +3,7 @@ import traceback
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from dependencies import setup_logging
+from dependencies import setup_logging, start_background_init, stop_background_tasks
 from routers import auth, system, kitsu, files, publish
 
 # Logging 설정
@@ -37,6 +37,15 @@ async def log_requests(request: Request, call_next):
         traceback.print_exc()
         raise
 
+@app.on_event("startup")
+def on_startup():
+    # 세션 복원과 업데이트 확인은 첫 응답을 막지 않도록 백그라운드에서 진행
+    start_background_init()
+
+@app.on_event("shutdown")
+def on_shutdown():
+    stop_background_tasks()
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(system.router)
@@ -1,7 +1,9 @@
 import traceback
 import logging
-import gazu
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from dependencies import kitsu_clients, config_manager
+from services.kitsu_client import normalize_host
 from schemas import LoginRequest, RestoreSessionRequest
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -11,22 +13,15 @@ logger = logging.getLogger("kitsu_publisher")
 def login(request: LoginRequest):
     logger.info(f"Login attempt for host: {request.host}, email: {request.email}")
     try:
-        host_url = request.host
-        if not host_url.startswith("http"):
-            host_url = "https://" + host_url
-        if not host_url.endswith("/api"):
-            host_url = host_url.rstrip("/") + "/api"
-            
+        host_url = normalize_host(request.host)
         logger.info(f"Setting Kitsu host to: {host_url}")
-        gazu.set_host(host_url)
-        tokens = gazu.log_in(request.email, request.password)
-        
-        user = gazu.client.get_current_user()
+        client = kitsu_clients.login(host_url, request.email, request.password)
         return {
             "message": "Login successful",
-            "user": user,
-            "tokens": tokens,
-            "host": host_url
+            "user": client.user,
+            "tokens": client.tokens,
+            "host": host_url,
+            "session_key": client.session_key
         }
     except Exception as e:
         logger.error(f"Login failed error: {str(e)}")
@@ -37,15 +32,25 @@ def login(request: LoginRequest):
 def restore_session(request: RestoreSessionRequest):
     logger.info(f"Restoring session for host: {request.host}")
     try:
-        gazu.set_host(request.host)
-        gazu.client.set_tokens(request.tokens)
-        user = gazu.client.get_current_user()
-        if not user:
-             raise HTTPException(status_code=401, detail="Invalid session")
+        client = kitsu_clients.restore(request.host, request.tokens)
         return {
             "message": "Session restored",
-            "user": user
+            "user": client.user,
+            "session_key": client.session_key
         }
     except Exception as e:
         logger.error(f"Session restore failed: {e}")
         raise HTTPException(status_code=401, detail="Session expired or invalid")
+
+@router.post("/logout")
+def logout(x_kitsu_session: Optional[str] = Header(default=None)):
+    """
+    세션을 닫고 저장된 세션을 지웁니다.
+    (지우지 않으면 다음 요청에서 저장된 세션이 다시 기본 세션으로 복원됨)
+    """
+    client = kitsu_clients.get(x_kitsu_session)
+    if client is not None:
+        logger.info(f"Logging out from host: {client.host}")
+        kitsu_clients.remove(client.session_key)
+    config_manager.set("session", None)
+    return {"message": "Logged out"}
@@ -1,113 +1,132 @@
 import os
+import asyncio
 import logging
-import gazu
 import traceback
-from typing import List
-from fastapi import APIRouter, HTTPException
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Literal, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Header
+from fastapi.responses import FileResponse, Response
 
-from schemas import ScanRequest, ScanResponseItem, MatchRequest, MatchResponse, TaskOption
-from dependencies import config_manager
-from services.parser import parse_filename
+from schemas import ScanRequest, ScanResponseItem, MatchRequest, MatchResponse, MatchBatchRequest
+from dependencies import config_manager, get_kitsu_client
+from services.kitsu_client import KitsuClient
+from services.parser import ParseCache
+from services.scanner import scan_files, VIDEO_EXTENSIONS
+from services.matcher import KitsuLookupCache, match_shot
+from services.columnar import ROWS_FORMAT, COLUMNAR_FORMAT, FastJSONResponse, StringTable, to_columns
+from services.thumbnails import ThumbnailCache, THUMBNAIL_SIZE, MAX_THUMBNAIL_SIZE
 
 router = APIRouter(prefix="/files", tags=["files"])
 logger = logging.getLogger("kitsu_publisher")
 
+# 스캔 간에 재사용되는 파일명 파싱 캐시 (설정 버전이 바뀌면 자동으로 비워짐)
+parse_cache = ParseCache()
+# 영상 포스터 썸네일 디스크 캐시 (~/.kitsu_publisher_data/thumbnails)
+thumbnail_cache = ThumbnailCache()
+
+# 배치 매칭 시 동시에 보내는 Kitsu 요청 수
+MATCH_BATCH_WORKERS = 8
+
+ResponseFormat = Literal["rows", "columnar"]
+
+# columnar 응답 컬럼 (file_path = directory + path_separator + filename)
+# available_tasks는 [task_id, 태스크 이름 인덱스] 쌍의 목록
+SCAN_COLUMNS = ("directory", "filename", "episode_name", "sequence_name", "shot_name", "task_name", "version")
+SCAN_INTERNED = ("directory", "episode_name", "sequence_name", "shot_name", "task_name")
+MATCH_COLUMNS = ("shot_id", "task_id", "match_status", "last_version", "available_tasks", "error")
+MATCH_INTERNED = ("match_status",)
+
 @router.post("/scan", response_model=List[ScanResponseItem])
-def scan_directory(request: ScanRequest):
+def scan_directory(request: ScanRequest, format: ResponseFormat = Query(ROWS_FORMAT)):
     logger.info(f"Scanning directory: {request.directory}")
     if not os.path.isdir(request.directory):
         raise HTTPException(status_code=400, detail="Invalid directory path")
 
-    results = []
-    video_extensions = {".mov", ".mp4"}
-    
     # 설정 미리 로드 (성능 최적화)
     # 전달받은 project_id에 따른 프로젝트별 설정을 먼저 가져옴
+    config_version = config_manager.version
     project_config = config_manager.get_project_config(request.project_id)
-    
-    pattern = project_config.get("filename_pattern")
-    seq_template = project_config.get("sequence_name_template")
-    shot_template = project_config.get("shot_name_template")
-    default_task = project_config.get("default_task_name")
-    
-    for root, _, files in os.walk(request.directory):
-        for file in files:
-            if file.startswith('.'):
-                continue
-            ext = os.path.splitext(file)[1].lower()
-            if ext in video_extensions:
-                file_path = os.path.join(root, file)
-                parsed = parse_filename(file, pattern, seq_template, shot_template, default_task)
-                if parsed:
-                    results.append(ScanResponseItem(
-                        file_path=file_path,
-                        filename=file,
-                        **parsed
-                    ))
-                else:
-                    results.append(ScanResponseItem(
-                        file_path=file_path,
-                        filename=file,
-                        episode_name=None, sequence_name="", shot_name="", task_name="", version=None
-                    ))
-    return results
+
+    items = scan_files(request.directory, request.project_id, project_config, config_version, parse_cache)
+    if format == COLUMNAR_FORMAT:
+        # 행마다 모델을 만들고 검증하지 않고 바로 컬럼 배열로 직렬화
+        rows = ({**item, "directory": os.path.dirname(item["file_path"])} for item in items)
+        payload = to_columns(rows, SCAN_COLUMNS, SCAN_INTERNED)
+        payload["path_separator"] = os.sep
+        return FastJSONResponse(payload)
+    return [ScanResponseItem(**item) for item in items]
 
 @router.post("/match-single", response_model=MatchResponse)
-def match_single_shot(request: MatchRequest):
+def match_single_shot(request: MatchRequest, client: KitsuClient = Depends(get_kitsu_client)):
     try:
-        project = gazu.project.get_project(request.project_id)
-        if not project:
-            return MatchResponse()
-
-        shot_id, task_id = None, None
-        available_tasks = []
-        match_status = "none"
-        last_version = None
-
-        all_sequences = gazu.shot.all_sequences_for_project(project)
-        sequence = next((s for s in all_sequences if s["name"].lower() == request.sequence_name.lower()), None)
-        
-        if sequence:
-            logger.debug(f"Sequence matched: {sequence['name']}")
-            all_shots = gazu.shot.all_shots_for_sequence(sequence)
-            
-            shot = next((s for s in all_shots if s["name"].lower() == request.shot_name.lower()), None)
-            if not shot:
-                short_name = request.shot_name.split('_')[-1]
-                shot = next((s for s in all_shots if s["name"].lower() == short_name.lower()), None)
-
-            if shot:
-                logger.debug(f"Shot matched: {shot['name']}")
-                shot_id = shot["id"]
-                match_status = "shot_only"
-                
-                all_tasks = gazu.task.all_tasks_for_shot(shot)
-                available_tasks = [TaskOption(id=t["id"], name=t["task_type_name"]) for t in all_tasks]
-                
-                matched_task = next((t for t in all_tasks if t["task_type_name"].lower() == request.task_name.lower()), None)
-                if matched_task:
-                    task_id = matched_task["id"]
-                    match_status = "full"
-                    
-                    try:
-                        previews = gazu.files.get_all_preview_files_for_task(matched_task)
-                        if previews and len(previews) > 0:
-                            last_version = max([int(p.get("revision", 0)) for p in previews])
-                            logger.debug(f"Task {request.task_name} has last version v{last_version}")
-                        else:
-                            last_version = 0
-                    except Exception as e:
-                        logger.warning(f"Failed to get previews: {e}")
-                        last_version = 0
-        
-        return MatchResponse(
-            shot_id=shot_id,
-            task_id=task_id,
-            available_tasks=available_tasks,
-            match_status=match_status,
-            last_version=last_version
-        )
+        result = match_shot(client, request.project_id, request.sequence_name, request.shot_name, request.task_name)
+        return MatchResponse(**result)
     except Exception as e:
         logger.error(f"Match failed: {e}")
         traceback.print_exc()
-        return MatchResponse()
+        return MatchResponse(error=f"Match failed: {e}")
+
+@router.post("/match-batch", response_model=List[MatchResponse])
+def match_batch(
+    request: MatchBatchRequest,
+    format: ResponseFormat = Query(ROWS_FORMAT),
+    client: KitsuClient = Depends(get_kitsu_client),
+):
+    """
+    여러 항목을 한 번에 매칭합니다. 같은 요청 안에서는 시퀀스/샷/태스크 조회 결과를 공유합니다.
+    결과는 요청 항목과 같은 순서로 반환됩니다.
+    """
+    logger.info(f"Matching {len(request.items)} items")
+    lookup_cache = KitsuLookupCache()
+
+    def match(item):
+        try:
+            return match_shot(
+                client, request.project_id, item.sequence_name, item.shot_name, item.task_name, cache=lookup_cache
+            )
+        except Exception as e:
+            logger.error(f"Match failed for {item.shot_name}: {e}")
+            return MatchResponse(error=f"Match failed: {e}").dict()
+
+    with ThreadPoolExecutor(max_workers=MATCH_BATCH_WORKERS) as pool:
+        results = list(pool.map(match, request.items))
+
+    if format == COLUMNAR_FORMAT:
+        # available_tasks는 [task_id, 태스크 이름 인덱스] 쌍의 목록으로 변환
+        table = StringTable()
+        table_rows = (
+            {**r, "available_tasks": [[t["id"], table.intern(t["name"])] for t in r["available_tasks"]]}
+            for r in results
+        )
+        return FastJSONResponse(to_columns(table_rows, MATCH_COLUMNS, MATCH_INTERNED, table=table))
+    return results
+
+@router.get("/thumbnail")
+async def get_thumbnail(
+    path: str,
+    size: int = Query(THUMBNAIL_SIZE, ge=16, le=MAX_THUMBNAIL_SIZE),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    영상 컨테이너에 들어 있는 포스터 이미지(커버 아트 또는 JPEG 프레임)로 만든 썸네일.
+    테이블에 보이는 행만 요청하도록 프론트엔드에서 지연 로드합니다.
+    생성은 썸네일 워커 풀에서 하고 여기서는 기다리기만 하므로, 요청이 몰려도
+    다른 API가 쓰는 스레드풀을 점유하지 않습니다.
+    """
+    if os.path.splitext(path)[1].lower() not in VIDEO_EXTENSIONS or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Video file not found")
+
+    try:
+        thumbnail_path = await asyncio.wrap_future(thumbnail_cache.submit(path, size))
+    except OSError as e:
+        logger.error(f"Thumbnail failed for {path}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if not thumbnail_path:
+        raise HTTPException(status_code=404, detail="No poster image in video")
+
+    # 캐시 키(파일 경로/크기/수정 시각)를 ETag로 사용하여 파일이 바뀌지 않았으면 304
+    etag = f'"{os.path.splitext(os.path.basename(thumbnail_path))[0]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(thumbnail_path, media_type="image/jpeg", headers=headers)
@@ -1,22 +1,23 @@
 import logging
-import gazu
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from dependencies import get_kitsu_client
+from services.kitsu_client import KitsuClient
 
 router = APIRouter(prefix="/kitsu", tags=["kitsu"])
 logger = logging.getLogger("kitsu_publisher")
 
 @router.get("/projects")
-def get_projects():
+def get_projects(client: KitsuClient = Depends(get_kitsu_client)):
     try:
-        return gazu.project.all_open_projects()
+        return client.all_open_projects()
     except Exception as e:
         logger.error(f"Failed to get projects: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/task-status-types")
-def get_task_status_types():
+def get_task_status_types(client: KitsuClient = Depends(get_kitsu_client)):
     try:
-        return gazu.task.all_task_statuses()
+        return client.all_task_statuses()
     except Exception as e:
         logger.error(f"Failed to get status types: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,32 +1,63 @@
 import logging
-import gazu
-from fastapi import APIRouter
-from schemas import PublishRequest
+import traceback
+from typing import Literal
+from fastapi import APIRouter, Depends, HTTPException, Query
+from dependencies import get_kitsu_client, project_states
+from schemas import PublishRequest, PlanRequest
+from services.kitsu_client import KitsuClient
+from services.publisher import publish_item
+from services.planner import build_plan, summarize_plan
+from services.columnar import ROWS_FORMAT, COLUMNAR_FORMAT, FastJSONResponse, StringTable, to_columns
 
 router = APIRouter(prefix="/publish", tags=["publish"])
 logger = logging.getLogger("kitsu_publisher")
 
+PLAN_COLUMNS = (
+    "file_path", "filename", "sequence_name", "shot_name", "task_name", "version",
+    "shot_id", "task_id", "available_tasks", "last_version", "status", "selected", "reason",
+)
+PLAN_INTERNED = ("sequence_name", "shot_name", "task_name", "status")
+
+@router.post("/plan")
+def plan_publish(
+    request: PlanRequest,
+    format: Literal["rows", "columnar"] = Query(ROWS_FORMAT),
+    client: KitsuClient = Depends(get_kitsu_client),
+):
+    """
+    스캔 결과를 캐시된 프로젝트 상태와 비교해 항목별 퍼블리시 여부를 분류합니다.
+    (new / outdated / already_published / duplicate / unmatched / unknown)
+    """
+    logger.info(f"Planning publish for {len(request.items)} files")
+    try:
+        state = project_states.get(client, request.project_id, refresh=request.refresh)
+        plan = build_plan(client, state, [item.dict() for item in request.items])
+    except Exception as e:
+        logger.error(f"Publish planning failed: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+    summary = summarize_plan(plan)
+    logger.info(f"Publish plan: {summary}")
+    if format == COLUMNAR_FORMAT:
+        # available_tasks는 /files/match-batch와 같이 [task_id, 태스크 이름 인덱스] 쌍의 목록으로 변환
+        table = StringTable()
+        table_rows = (
+            {**entry, "available_tasks": [[t["id"], table.intern(t["name"])] for t in entry["available_tasks"]]}
+            for entry in plan
+        )
+        items = to_columns(table_rows, PLAN_COLUMNS, PLAN_INTERNED, table=table)
+        return FastJSONResponse({"summary": summary, "items": items})
+    return FastJSONResponse({"summary": summary, "items": plan})
+
 @router.post("/execute")
-def execute_publish(request: PublishRequest):
+def execute_publish(request: PublishRequest, client: KitsuClient = Depends(get_kitsu_client)):
     logger.info(f"Executing publish for {len(request.items)} items")
     results = []
     for item in request.items:
-        filename = item.file_path.split("/")[-1] if "/" in item.file_path else item.file_path
-        logger.info(f"Starting publish for: {filename}")
-        try:
-            logger.info(f"  - Getting task and status for {filename}")
-            task = gazu.task.get_task(item.task_id)
-            task_status = gazu.task.get_task_status(item.task_status_id)
-            
-            logger.info(f"  - Adding comment for {filename}")
-            comment = gazu.task.add_comment(task, task_status, item.comment or "Published via Batch Publisher")
-            
-            logger.info(f"  - Uploading preview file for {filename} (This may take a while...)")
-            gazu.task.add_preview(task, comment, item.file_path)
-            
-            logger.info(f"Successfully published: {filename}")
-            results.append({"file_path": item.file_path, "status": "success"})
-        except Exception as e:
-            logger.error(f"Publish failed for {item.file_path}: {e}")
-            results.append({"file_path": item.file_path, "status": "error", "message": str(e)})
+        result = publish_item(client, item.file_path, item.task_id, item.task_status_id, item.comment)
+        if result["status"] == "success":
+            # 다음 계획 시 해당 태스크의 마지막 버전을 다시 조회
+            project_states.forget_last_version(item.task_id)
+        results.append(result)
     return results
@@ -1,6 +1,7 @@
 from typing import Dict, Any
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from dependencies import config_manager, updater, log_queue
 from schemas import ConfigModel
 from services.parser import parse_filename
@@ -9,7 +10,7 @@ router = APIRouter(tags=["system"])
 
 @router.get("/system/config")
 def get_config():
-    return config_manager.config
+    return config_manager.snapshot()
 
 @router.get("/system/config/projects/{project_id}")
 def get_project_config(project_id: str):
@@ -25,7 +26,7 @@ def update_config(config: ConfigModel):
     # 전역 설정 저장 (project_settings 제외)
     new_data = config.dict()
     config_manager.save_config(new_data)
-    return {"status": "updated", "config": config_manager.config}
+    return {"status": "updated", "config": config_manager.snapshot()}
 
 @router.post("/system/preview-parse")
 def preview_parse(payload: Dict[str, Any]):
@@ -57,8 +58,9 @@ def preview_parse(payload: Dict[str, Any]):
         return {"success": False, "message": "Does not match the current pattern"}
 
 @router.get("/system/check-update")
-def check_update():
-    return updater.check_for_updates()
+async def check_update():
+    # 캐시가 없을 때만 GitHub 요청이 발생하므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    return await run_in_threadpool(updater.get_update_info)
 
 @router.post("/system/open-url")
 def open_url(payload: Dict[str, str]):
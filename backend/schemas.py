@@ -44,12 +44,28 @@ class MatchRequest(BaseModel):
     shot_name: str
     task_name: str
 
+class PlanRequest(BaseModel):
+    project_id: str
+    items: List[ScanResponseItem]
+    refresh: bool = False
+
+class MatchBatchItem(BaseModel):
+    episode_name: Optional[str] = None
+    sequence_name: str
+    shot_name: str
+    task_name: str
+
+class MatchBatchRequest(BaseModel):
+    project_id: str
+    items: List[MatchBatchItem]
+
 class MatchResponse(BaseModel):
     shot_id: Optional[str] = None
     task_id: Optional[str] = None
     available_tasks: List[TaskOption] = []
     match_status: str = "none"
     last_version: Optional[int] = None
+    error: Optional[str] = None
 
 class ConfigModel(BaseModel):
     default_task_name: str
@@ -0,0 +1,72 @@
+import json
+from typing import Dict, Any, List, Iterable, Optional, Sequence
+
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # 의존성이 설치되지 않은 환경에서는 표준 json 사용
+    orjson = None
+
+# 응답 형식: rows(기존 객체 배열, 기본값) / columnar(컬럼 배열 + 문자열 테이블)
+ROWS_FORMAT = "rows"
+COLUMNAR_FORMAT = "columnar"
+
+class StringTable:
+    """반복되는 문자열(시퀀스/샷/태스크 이름 등)을 한 번만 담고 인덱스로 참조하기 위한 테이블"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> Optional[int]:
+        if value is None:
+            return None
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self.strings)
+            self._index[value] = idx
+            self.strings.append(value)
+        return idx
+
+def to_columns(
+    rows: Iterable[Dict[str, Any]],
+    columns: Sequence[str],
+    interned: Sequence[str] = (),
+    table: Optional[StringTable] = None,
+) -> Dict[str, Any]:
+    """
+    dict 행 목록을 컬럼 배열 형태로 변환합니다.
+    `interned`에 포함된 컬럼의 값은 `strings` 테이블의 인덱스(None은 null)로 저장됩니다.
+    중첩된 값을 미리 intern 했다면 같은 `table`을 넘겨 하나의 테이블을 공유할 수 있습니다.
+    """
+    table = table or StringTable()
+    interned_set = set(interned)
+    data: Dict[str, List[Any]] = {column: [] for column in columns}
+    count = 0
+    for row in rows:
+        count += 1
+        for column in columns:
+            value = row.get(column)
+            if column in interned_set:
+                value = table.intern(value)
+            data[column].append(value)
+    return {
+        "format": COLUMNAR_FORMAT,
+        "count": count,
+        "strings": table.strings,
+        "interned": list(interned),
+        "columns": data,
+    }
+
+class FastJSONResponse(Response):
+    """
+    response_model 검증을 거치지 않고 바로 직렬화하는 JSON 응답.
+    orjson이 설치되어 있으면 사용하고, 없으면 공백 없는 표준 json으로 인코딩합니다.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
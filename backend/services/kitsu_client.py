@@ -0,0 +1,303 @@
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Callable
+
+from lazy import LazyModule
+
+# PyInstaller가 정적 분석으로 찾지 못하므로 빌드 시 --hidden-import gazu 필요 (README 참고)
+gazu = LazyModule("gazu")
+logger = logging.getLogger("kitsu_publisher")
+
+# 세션별 커넥션 풀 크기 (동시 업로드/매칭 요청 수에 맞춤)
+POOL_SIZE = 16
+
+# 액세스 토큰 만료 이 시간(초) 전에 미리 갱신
+REFRESH_MARGIN_SECONDS = 5 * 60
+# 백그라운드 토큰 갱신 확인 주기 (초)
+REFRESH_CHECK_INTERVAL = 60
+
+def normalize_host(host: str) -> str:
+    host_url = host.strip()
+    if not host_url.startswith("http"):
+        host_url = "https://" + host_url
+    if not host_url.endswith("/api"):
+        host_url = host_url.rstrip("/") + "/api"
+    return host_url
+
+def make_session_key(host: str, user_id: str) -> str:
+    """같은 호스트/계정이면 항상 같은 키가 나오도록 해시로 생성"""
+    return hashlib.sha256(f"{host}|{user_id}".encode("utf-8")).hexdigest()[:32]
+
+def _read_token_claims(token: Optional[str]) -> Dict[str, Any]:
+    """JWT 페이로드를 읽습니다. 서명 검증은 하지 않습니다."""
+    if not token:
+        return {}
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return claims if isinstance(claims, dict) else {}
+    except (IndexError, ValueError, TypeError):
+        return {}
+
+class KitsuClient:
+    """
+    하나의 Kitsu 호스트/계정에 대한 세션.
+
+    gazu의 전역 클라이언트(gazu.set_host 등)를 건드리지 않고 각자 별도의
+    gazu 클라이언트와 requests 커넥션 풀을 가지므로, 여러 호스트/계정에 대해
+    동시에 요청해도 서로 간섭하지 않습니다.
+    """
+
+    def __init__(self, host: str, tokens: Optional[Dict[str, Any]] = None, pool_size: int = POOL_SIZE):
+        from requests.adapters import HTTPAdapter
+
+        self.host = normalize_host(host)
+        self.user: Optional[Dict[str, Any]] = None
+        self.session_key: Optional[str] = None
+        # 토큰이 갱신되면 호출됨 (저장된 세션 업데이트용)
+        self.on_tokens_refreshed: Optional[Callable[["KitsuClient"], None]] = None
+        self._refresh_lock = threading.Lock()
+        self.raw = gazu.client.create_client(self.host)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.raw.session.mount("http://", adapter)
+        self.raw.session.mount("https://", adapter)
+        if tokens:
+            self.set_tokens(tokens)
+
+    @property
+    def tokens(self) -> Dict[str, Any]:
+        return dict(self.raw.tokens)
+
+    def set_tokens(self, tokens: Dict[str, Any]):
+        gazu.client.set_tokens(dict(tokens), client=self.raw)
+
+    def needs_refresh(self, margin: float = REFRESH_MARGIN_SECONDS) -> bool:
+        claims = _read_token_claims(self.raw.access_token)
+        try:
+            expiry = float(claims["exp"])
+        except (KeyError, ValueError, TypeError):
+            return False
+        if "iat" in claims:
+            # 토큰 수명이 짧으면 매 요청마다 갱신하지 않도록 여유 시간을 수명의 절반 이하로 제한
+            try:
+                margin = min(margin, (expiry - float(claims["iat"])) / 2)
+            except (ValueError, TypeError):
+                pass
+        return bool(self.raw.refresh_token) and expiry - time.time() < margin
+
+    def refresh_tokens(self, stale_access_token: Optional[str] = None) -> bool:
+        """
+        리프레시 토큰으로 액세스 토큰을 갱신합니다.
+        stale_access_token이 주어졌는데 그 사이 다른 스레드가 이미 갱신했다면 다시 갱신하지 않습니다.
+        """
+        with self._refresh_lock:
+            if stale_access_token is not None and self.raw.access_token != stale_access_token:
+                return True
+            refresh_token = self.raw.refresh_token
+            if not refresh_token:
+                return False
+            try:
+                self.raw.refresh_access_token()
+            except Exception as e:
+                logger.warning(f"Failed to refresh Kitsu token for {self.host}: {e}")
+                return False
+            finally:
+                # Kitsu의 갱신 응답에는 access_token만 있고, gazu 버전에 따라 refresh_token을
+                # None으로 지우므로 기존 값을 유지 (그래야 다음 만료 때도 갱신 가능)
+                if not self.raw.refresh_token:
+                    self.raw.refresh_token = refresh_token
+        logger.info(f"Kitsu access token refreshed for {self.host}")
+        if self.on_tokens_refreshed is not None:
+            try:
+                self.on_tokens_refreshed(self)
+            except Exception as e:
+                logger.error(f"Failed to persist refreshed tokens: {e}")
+        return True
+
+    def _call(self, func: Callable, *args, **kwargs):
+        """
+        gazu 함수를 이 세션의 클라이언트로 호출합니다.
+        만료가 임박했으면 먼저 갱신하고, 그래도 401이 나면 한 번 갱신 후 재시도합니다.
+        """
+        if self.needs_refresh():
+            self.refresh_tokens(self.raw.access_token)
+        access_token = self.raw.access_token
+        try:
+            return func(*args, client=self.raw, **kwargs)
+        except gazu.exception.NotAuthenticatedException:
+            if not self.refresh_tokens(access_token):
+                raise
+            logger.info("Retrying Kitsu request after token refresh")
+            return func(*args, client=self.raw, **kwargs)
+
+    # 인증
+    def log_in(self, email: str, password: str) -> Dict[str, Any]:
+        tokens = gazu.log_in(email, password, client=self.raw)
+        self.user = self.get_current_user()
+        return tokens
+
+    def get_current_user(self) -> Dict[str, Any]:
+        self.user = self._call(gazu.client.get_current_user)
+        return self.user
+
+    # 조회
+    def all_open_projects(self) -> List[Dict[str, Any]]:
+        return self._call(gazu.project.all_open_projects)
+
+    def get_project(self, project_id: str) -> Dict[str, Any]:
+        return self._call(gazu.project.get_project, project_id)
+
+    def all_task_statuses(self) -> List[Dict[str, Any]]:
+        return self._call(gazu.task.all_task_statuses)
+
+    def all_sequences_for_project(self, project) -> List[Dict[str, Any]]:
+        return self._call(gazu.shot.all_sequences_for_project, project)
+
+    def all_shots_for_sequence(self, sequence) -> List[Dict[str, Any]]:
+        return self._call(gazu.shot.all_shots_for_sequence, sequence)
+
+    def all_shots_for_project(self, project) -> List[Dict[str, Any]]:
+        return self._call(gazu.shot.all_shots_for_project, project)
+
+    def all_tasks_for_project(self, project) -> List[Dict[str, Any]]:
+        return self._call(gazu.task.all_tasks_for_project, project)
+
+    def all_task_types(self) -> List[Dict[str, Any]]:
+        return self._call(gazu.task.all_task_types)
+
+    def all_tasks_for_shot(self, shot) -> List[Dict[str, Any]]:
+        return self._call(gazu.task.all_tasks_for_shot, shot)
+
+    def get_all_preview_files_for_task(self, task) -> List[Dict[str, Any]]:
+        return self._call(gazu.files.get_all_preview_files_for_task, task)
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        return self._call(gazu.task.get_task, task_id)
+
+    def get_task_status(self, task_status_id: str) -> Dict[str, Any]:
+        return self._call(gazu.task.get_task_status, task_status_id)
+
+    # 퍼블리시
+    def add_comment(self, task, task_status, comment: str) -> Dict[str, Any]:
+        return self._call(gazu.task.add_comment, task, task_status, comment)
+
+    def add_preview(self, task, comment, file_path: str) -> Dict[str, Any]:
+        # gazu.task.add_preview를 두 단계로 나눠 호출: 업로드 중 401로 재시도해도
+        # 프리뷰 revision을 새로 만들지 않고 실패한 업로드만 다시 시도
+        preview_file = self._call(gazu.task.create_preview, task, comment)
+        return self._call(gazu.task.upload_preview_file, preview_file, file_path)
+
+    def close(self):
+        self.raw.session.close()
+
+class KitsuClientRegistry:
+    """
+    세션 키 -> KitsuClient 매핑.
+    요청에 세션 키가 없으면 가장 최근에 로그인/복원된 세션을 기본값으로 사용합니다.
+    백그라운드 스레드가 만료가 임박한 세션의 토큰을 미리 갱신합니다.
+    """
+
+    def __init__(self, on_tokens_refreshed: Optional[Callable[[KitsuClient], None]] = None):
+        self.on_tokens_refreshed = on_tokens_refreshed
+        self._lock = threading.Lock()
+        self._clients: Dict[str, KitsuClient] = {}
+        self._default_key: Optional[str] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def _user_id(client: KitsuClient) -> str:
+        """세션 키에 쓸 사용자 ID. 저장된 토큰이나 JWT에 있으면 네트워크 요청 없이 사용합니다."""
+        if client.user and client.user.get("id"):
+            return client.user["id"]
+        saved_user = client.raw.tokens.get("user") or {}
+        if saved_user.get("id"):
+            return saved_user["id"]
+        claims = _read_token_claims(client.raw.access_token)
+        user_id = claims.get("sub") or claims.get("identity")
+        if isinstance(user_id, str) and user_id:
+            return user_id
+        return client.get_current_user()["id"]
+
+    def register(self, client: KitsuClient, make_default: bool = True) -> str:
+        key = make_session_key(client.host, self._user_id(client))
+        client.session_key = key
+        client.on_tokens_refreshed = self.on_tokens_refreshed
+        with self._lock:
+            previous = self._clients.get(key)
+            self._clients[key] = client
+            if make_default:
+                self._default_key = key
+        if previous is not None and previous is not client:
+            previous.close()
+        return key
+
+    def login(self, host: str, email: str, password: str) -> KitsuClient:
+        client = KitsuClient(host)
+        client.log_in(email, password)
+        self.register(client)
+        return client
+
+    def restore(self, host: str, tokens: Dict[str, Any], verify: bool = True) -> KitsuClient:
+        """
+        저장된 토큰으로 세션을 복원합니다.
+        verify=False 이면 서버에 확인하지 않고 바로 등록합니다. (오프라인으로 시작해도 세션 유지,
+        만료된 토큰은 첫 요청에서 갱신 후 재시도)
+        """
+        client = KitsuClient(host, tokens)
+        # 확인 요청 중에 토큰이 갱신되어도 저장되도록 콜백을 먼저 연결
+        client.on_tokens_refreshed = self.on_tokens_refreshed
+        if verify:
+            user = client.get_current_user()
+            if not user:
+                raise ValueError("Invalid session")
+        elif isinstance(tokens.get("user"), dict):
+            client.user = tokens["user"]
+        self.register(client)
+        return client
+
+    def get(self, session_key: Optional[str] = None) -> Optional[KitsuClient]:
+        with self._lock:
+            key = session_key or self._default_key
+            if key is None:
+                return None
+            return self._clients.get(key)
+
+    def remove(self, session_key: str):
+        with self._lock:
+            client = self._clients.pop(session_key, None)
+            if self._default_key == session_key:
+                self._default_key = None
+        if client is not None:
+            client.close()
+
+    def refresh_expiring(self, margin: float = REFRESH_MARGIN_SECONDS):
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            if client.needs_refresh(margin):
+                client.refresh_tokens(client.raw.access_token)
+
+    def _refresh_loop(self, interval: float):
+        while not self._stop_event.wait(interval):
+            try:
+                self.refresh_expiring()
+            except Exception as e:
+                logger.error(f"Token refresh check failed: {e}")
+
+    def start_refresher(self, interval: float = REFRESH_CHECK_INTERVAL):
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        self._stop_event.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, args=(interval,), name="kitsu-token-refresh", daemon=True
+        )
+        self._refresher.start()
+
+    def stop_refresher(self):
+        self._stop_event.set()
@@ -0,0 +1,107 @@
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Callable
+
+from services.kitsu_client import KitsuClient
+
+logger = logging.getLogger("kitsu_publisher")
+
+class KitsuLookupCache:
+    """
+    한 번의 배치 작업 동안 프로젝트/시퀀스/샷/태스크 조회 결과를 재사용하기 위한 캐시.
+    같은 시퀀스의 파일이 여러 개여도 Kitsu 요청은 한 번만 보냅니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Any, Any] = {}
+        self._key_locks: Dict[Any, threading.Lock] = {}
+
+    def get_or_fetch(self, key, fetch: Callable[[], Any]):
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        # 같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 실제로 조회
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = fetch()
+            with self._lock:
+                self._values[key] = value
+            return value
+
+def _fetch(cache: Optional[KitsuLookupCache], key, fetch: Callable[[], Any]):
+    if cache is None:
+        return fetch()
+    return cache.get_or_fetch(key, fetch)
+
+def get_last_version(client: KitsuClient, task: Dict[str, Any]) -> int:
+    """태스크에 올라간 프리뷰 중 가장 높은 리비전. 조회에 실패하면 예외를 그대로 올립니다."""
+    previews = client.get_all_preview_files_for_task(task)
+    if previews and len(previews) > 0:
+        return max([int(p.get("revision", 0)) for p in previews])
+    return 0
+
+def match_shot(
+    client: KitsuClient,
+    project_id: str,
+    sequence_name: str,
+    shot_name: str,
+    task_name: str,
+    cache: Optional[KitsuLookupCache] = None,
+) -> Dict[str, Any]:
+    """
+    파싱된 시퀀스/샷/태스크 이름을 Kitsu 엔티티와 매칭합니다.
+    반환값은 MatchResponse와 같은 형태의 dict 입니다.
+    마지막 버전 조회에 실패하면 last_version은 None, error에 실패 사유가 들어갑니다.
+    """
+    result: Dict[str, Any] = {
+        "shot_id": None,
+        "task_id": None,
+        "available_tasks": [],
+        "match_status": "none",
+        "last_version": None,
+        "error": None,
+    }
+
+    project = _fetch(cache, ("project", project_id), lambda: client.get_project(project_id))
+    if not project:
+        return result
+
+    all_sequences = _fetch(cache, ("sequences", project_id), lambda: client.all_sequences_for_project(project))
+    sequence = next((s for s in all_sequences if s["name"].lower() == sequence_name.lower()), None)
+    if not sequence:
+        return result
+
+    logger.debug(f"Sequence matched: {sequence['name']}")
+    all_shots = _fetch(cache, ("shots", sequence["id"]), lambda: client.all_shots_for_sequence(sequence))
+
+    shot = next((s for s in all_shots if s["name"].lower() == shot_name.lower()), None)
+    if not shot:
+        short_name = shot_name.split('_')[-1]
+        shot = next((s for s in all_shots if s["name"].lower() == short_name.lower()), None)
+    if not shot:
+        return result
+
+    logger.debug(f"Shot matched: {shot['name']}")
+    result["shot_id"] = shot["id"]
+    result["match_status"] = "shot_only"
+
+    all_tasks: List[Dict[str, Any]] = _fetch(cache, ("tasks", shot["id"]), lambda: client.all_tasks_for_shot(shot))
+    result["available_tasks"] = [{"id": t["id"], "name": t["task_type_name"]} for t in all_tasks]
+
+    matched_task = next((t for t in all_tasks if t["task_type_name"].lower() == task_name.lower()), None)
+    if matched_task:
+        result["task_id"] = matched_task["id"]
+        result["match_status"] = "full"
+        try:
+            result["last_version"] = get_last_version(client, matched_task)
+        except Exception as e:
+            # 0으로 간주하면 이미 올라간 버전을 다시 퍼블리쉬하게 되므로 알 수 없음으로 남김
+            logger.warning(f"Failed to get previews for task {matched_task['id']}: {e}")
+            result["error"] = f"Failed to get last version: {e}"
+            return result
+        logger.debug(f"Task {task_name} has last version v{result['last_version']}")
+    return result
@@ -0,0 +1,138 @@
+import struct
+import logging
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+logger = logging.getLogger("kitsu_publisher")
+
+# 각 프레임이 그대로 JPEG인 코덱 (Photo-JPEG, Motion JPEG A)
+JPEG_CODECS = {b"jpeg", b"mjpa"}
+# covr/data 박스의 데이터 타입
+COVER_TYPE_JPEG = 13
+COVER_TYPE_PNG = 14
+
+# 비정상적인 파일에서 메모리를 과도하게 쓰지 않도록 읽을 이미지 최대 크기
+MAX_IMAGE_BYTES = 32 * 1024 * 1024
+
+Box = Tuple[bytes, int, int]  # (타입, 페이로드 시작 위치, 페이로드 끝 위치)
+
+def iter_boxes(f: BinaryIO, start: int, end: int) -> Iterator[Box]:
+    """[start, end) 범위의 박스 헤더를 순서대로 읽습니다. 페이로드는 읽지 않고 건너뜁니다."""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            large = f.read(8)
+            if len(large) < 8:
+                return
+            size = struct.unpack(">Q", large)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size or offset + size > end:
+            return
+        yield box_type, offset + header_size, offset + size
+        offset += size
+
+def find_box(f: BinaryIO, start: int, end: int, box_type: bytes) -> Optional[Box]:
+    return next((box for box in iter_boxes(f, start, end) if box[0] == box_type), None)
+
+def _read(f: BinaryIO, offset: int, length: int) -> bytes:
+    f.seek(offset)
+    return f.read(length)
+
+def _meta_children_start(f: BinaryIO, start: int) -> int:
+    # MP4의 meta는 version/flags 4바이트가 붙는 full box, QuickTime의 meta는 일반 컨테이너
+    return start + 4 if _read(f, start, 4) == b"\0\0\0\0" else start
+
+def _find_cover(f: BinaryIO, start: int, end: int) -> Optional[bytes]:
+    """moov/udta/meta/ilst/covr/data 에 들어 있는 커버 이미지"""
+    udta = find_box(f, start, end, b"udta")
+    if not udta:
+        return None
+    meta = find_box(f, udta[1], udta[2], b"meta")
+    if not meta:
+        return None
+    ilst = find_box(f, _meta_children_start(f, meta[1]), meta[2], b"ilst")
+    if not ilst:
+        return None
+    covr = find_box(f, ilst[1], ilst[2], b"covr")
+    if not covr:
+        return None
+    for box_type, data_start, data_end in iter_boxes(f, covr[1], covr[2]):
+        if box_type != b"data" or data_end - data_start <= 8:
+            continue
+        data_type = struct.unpack(">I", _read(f, data_start, 4))[0] & 0xFFFFFF
+        if data_type in (COVER_TYPE_JPEG, COVER_TYPE_PNG) and data_end - data_start - 8 <= MAX_IMAGE_BYTES:
+            return _read(f, data_start + 8, data_end - data_start - 8)
+    return None
+
+def _first_sample_range(f: BinaryIO, stbl: Box) -> Optional[Tuple[int, int]]:
+    """stsz/stco(co64)에서 첫 샘플의 파일 내 위치와 크기"""
+    stsz = find_box(f, stbl[1], stbl[2], b"stsz")
+    if not stsz:
+        return None
+    _, sample_size, sample_count = struct.unpack(">III", _read(f, stsz[1], 12))
+    if sample_count == 0:
+        return None
+    if sample_size == 0:
+        sample_size = struct.unpack(">I", _read(f, stsz[1] + 12, 4))[0]
+
+    stco = find_box(f, stbl[1], stbl[2], b"stco")
+    if stco:
+        _, entry_count, chunk_offset = struct.unpack(">III", _read(f, stco[1], 12))
+    else:
+        co64 = find_box(f, stbl[1], stbl[2], b"co64")
+        if not co64:
+            return None
+        _, entry_count, chunk_offset = struct.unpack(">IIQ", _read(f, co64[1], 16))
+    if entry_count == 0:
+        return None
+    return chunk_offset, sample_size
+
+def _find_jpeg_frame(f: BinaryIO, start: int, end: int) -> Optional[bytes]:
+    """코덱이 JPEG 계열인 비디오 트랙의 첫 프레임"""
+    for box_type, trak_start, trak_end in iter_boxes(f, start, end):
+        if box_type != b"trak":
+            continue
+        mdia = find_box(f, trak_start, trak_end, b"mdia")
+        minf = mdia and find_box(f, mdia[1], mdia[2], b"minf")
+        stbl = minf and find_box(f, minf[1], minf[2], b"stbl")
+        stsd = stbl and find_box(f, stbl[1], stbl[2], b"stsd")
+        if not stsd:
+            continue
+        # stsd: version/flags(4) + entry_count(4) + 첫 sample entry(size(4) + codec(4))
+        codec = _read(f, stsd[1] + 12, 4)
+        if codec not in JPEG_CODECS:
+            continue
+        sample = _first_sample_range(f, stbl)
+        if not sample or sample[1] > MAX_IMAGE_BYTES:
+            continue
+        data = _read(f, *sample)
+        if data[:2] == b"\xff\xd8":
+            return data
+    return None
+
+def extract_poster(path: str) -> Optional[bytes]:
+    """
+    영상을 디코딩하지 않고 컨테이너에 이미 들어 있는 이미지를 꺼냅니다.
+    커버 아트(covr)를 우선 사용하고, 없으면 JPEG 코덱 트랙의 첫 프레임을 사용합니다.
+    둘 다 없거나 박스 구조가 잘려 있으면 None을 반환합니다. 파일 읽기 오류(OSError)는 그대로 올립니다.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        moov = find_box(f, 0, file_size, b"moov")
+        if not moov:
+            logger.debug(f"No moov box in {path}")
+            return None
+        try:
+            return _find_cover(f, moov[1], moov[2]) or _find_jpeg_frame(f, moov[1], moov[2])
+        except struct.error:
+            # 박스 크기보다 짧게 읽힌 경우 (손상되었거나 잘린 파일)
+            logger.debug(f"Truncated box in {path}")
+            return None
@@ -1,26 +1,18 @@
 import os
 import re
 import logging
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger("kitsu_publisher")
 
-def parse_filename(
-    filename: str, 
-    pattern_str: str, 
-    seq_template: str, 
-    shot_template: str, 
-    default_task_name: str
-) -> Optional[dict]:
+@lru_cache(maxsize=64)
+def compile_pattern(pattern_str: str) -> Optional[re.Pattern]:
     """
-    파일명과 설정된 패턴들을 기반으로 메타데이터를 추출합니다.
-    모든 패턴 인자는 필수입니다. 호출하는 측에서 Config를 조회하여 전달해야 합니다.
+    파일명 패턴을 정규식으로 컴파일합니다. 같은 패턴은 한 번만 컴파일됩니다.
     """
-    
-    if not pattern_str:
-        return None
-    
-    # 2. 패턴을 정규식으로 변환
+    # 패턴을 정규식으로 변환
     # 지원 문법:
     # {key} -> (?P<key>.+?)
     # [ ... ] -> (?: ... )?  (Optional)
@@ -67,15 +59,35 @@ def parse_filename(
     
     logger.debug(f"Generated Regex: {regex_pattern}") # Info -> Debug로 변경 (로그 과다 방지)
 
-    # 확장자 제거 후 매칭
-    name_without_ext = os.path.splitext(filename)[0]
-    
     try:
-        match = re.match(regex_pattern, name_without_ext)
+        return re.compile(regex_pattern)
     except re.error as e:
         logger.error(f"Invalid regex generated: {regex_pattern} - {e}")
         return None
 
+def parse_filename(
+    filename: str, 
+    pattern_str: str, 
+    seq_template: str, 
+    shot_template: str, 
+    default_task_name: str
+) -> Optional[dict]:
+    """
+    파일명과 설정된 패턴들을 기반으로 메타데이터를 추출합니다.
+    모든 패턴 인자는 필수입니다. 호출하는 측에서 Config를 조회하여 전달해야 합니다.
+    """
+    
+    if not pattern_str:
+        return None
+    
+    regex = compile_pattern(pattern_str)
+    if regex is None:
+        return None
+
+    # 확장자 제거 후 매칭
+    name_without_ext = os.path.splitext(filename)[0]
+    
+    match = regex.match(name_without_ext)
     if not match:
         # 매칭 실패 로그는 디버그 레벨로 낮춤 (스캔 시 너무 많이 뜰 수 있음)
         logger.debug(f"No match for '{name_without_ext}' against pattern '{pattern_str}'")
@@ -120,3 +132,42 @@ def parse_filename(
         "task_name": task_name,
         "version": int(data.get("version", 0))
     }
+
+
+class ParseCache:
+    """
+    파일명 파싱 결과 캐시.
+    ConfigManager.version 이 바뀌면 (패턴/템플릿 변경 가능성) 전체 캐시를 비웁니다.
+    """
+
+    def __init__(self, max_entries: int = 200000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._entries: Dict[Tuple[str, str], Optional[dict]] = {}
+
+    def parse(self, config_version: int, project_id: str, filename: str, project_config: Dict[str, Any]) -> Optional[dict]:
+        key = (project_id, filename)
+        with self._lock:
+            if config_version != self._version:
+                self._entries.clear()
+                self._version = config_version
+            if key in self._entries:
+                cached = self._entries[key]
+                return dict(cached) if cached is not None else None
+
+        parsed = parse_filename(
+            filename,
+            project_config.get("filename_pattern"),
+            project_config.get("sequence_name_template"),
+            project_config.get("shot_name_template"),
+            project_config.get("default_task_name"),
+        )
+
+        with self._lock:
+            # 파싱 도중 설정이 바뀌었다면 오래된 결과를 저장하지 않음
+            if config_version == self._version:
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+                self._entries[key] = parsed
+        return dict(parsed) if parsed is not None else None
@@ -0,0 +1,228 @@
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+
+from services.kitsu_client import KitsuClient
+
+logger = logging.getLogger("kitsu_publisher")
+
+# 프로젝트 상태 캐시 유지 시간 (초)
+PROJECT_STATE_TTL = 5 * 60
+# 마지막 버전(프리뷰 revision) 조회 시 동시 요청 수
+LAST_VERSION_WORKERS = 8
+
+# 퍼블리시 계획 분류
+PLAN_NEW = "new"                              # Kitsu보다 새 버전 -> 퍼블리시 대상
+PLAN_OUTDATED = "outdated"                    # Kitsu 또는 로컬에 더 새 버전이 있음
+PLAN_ALREADY_PUBLISHED = "already_published"  # Kitsu 최신 버전과 같음
+PLAN_DUPLICATE = "duplicate"                  # 같은 샷/태스크에 같은 버전 파일이 여러 개
+PLAN_UNMATCHED = "unmatched"                  # 파싱 또는 Kitsu 매칭 실패
+PLAN_UNKNOWN = "unknown"                      # Kitsu 마지막 버전 조회 실패 (퍼블리시 여부 판단 불가)
+
+class ProjectState:
+    """
+    한 프로젝트의 시퀀스/샷/태스크를 몇 번의 일괄 요청으로 불러와 이름으로 바로 찾을 수 있게 색인한 상태.
+    태스크별 마지막 버전은 필요한 태스크에 대해서만 조회하여 캐시합니다.
+    """
+
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        self.loaded_at = 0.0
+        # 이름(소문자) -> 엔티티
+        self.sequences: Dict[str, Dict[str, Any]] = {}
+        # (sequence_id, 샷 이름 소문자) -> 샷
+        self.shots: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # shot_id -> [태스크]
+        self.tasks_by_shot: Dict[str, List[Dict[str, Any]]] = {}
+        # task_id -> 마지막 revision
+        self.last_versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, client: KitsuClient, project_id: str) -> "ProjectState":
+        state = cls(project_id)
+        project = {"id": project_id}
+        sequences = client.all_sequences_for_project(project)
+        shots = client.all_shots_for_project(project)
+        task_type_names = {t["id"]: t["name"] for t in client.all_task_types()}
+        tasks = client.all_tasks_for_project(project)
+
+        for sequence in sequences:
+            state.sequences[sequence["name"].lower()] = sequence
+        for shot in shots:
+            sequence_id = shot.get("sequence_id") or shot.get("parent_id")
+            state.shots[(sequence_id, shot["name"].lower())] = shot
+        for task in tasks:
+            task_type_name = task.get("task_type_name") or task_type_names.get(task.get("task_type_id"), "")
+            state.tasks_by_shot.setdefault(task["entity_id"], []).append(
+                {"id": task["id"], "task_type_name": task_type_name}
+            )
+            # 프리뷰가 하나도 없는 태스크는 추가 요청 없이 0으로 확정
+            if "last_preview_file_id" in task and not task["last_preview_file_id"]:
+                state.last_versions[task["id"]] = 0
+
+        state.loaded_at = time.time()
+        logger.info(
+            f"Loaded project state: {len(state.sequences)} sequences, {len(state.shots)} shots, {len(tasks)} tasks"
+        )
+        return state
+
+    def is_fresh(self, ttl: float = PROJECT_STATE_TTL) -> bool:
+        return time.time() - self.loaded_at < ttl
+
+    def find_shot(self, sequence_name: str, shot_name: str) -> Optional[Dict[str, Any]]:
+        sequence = self.sequences.get(sequence_name.lower())
+        if not sequence:
+            return None
+        shot = self.shots.get((sequence["id"], shot_name.lower()))
+        if not shot:
+            short_name = shot_name.split('_')[-1]
+            shot = self.shots.get((sequence["id"], short_name.lower()))
+        return shot
+
+    def find_task(self, shot_id: str, task_name: str) -> Optional[Dict[str, Any]]:
+        lowered = task_name.lower()
+        return next((t for t in self.tasks_by_shot.get(shot_id, []) if t["task_type_name"].lower() == lowered), None)
+
+    def ensure_last_versions(
+        self, client: KitsuClient, task_ids: Iterable[str], workers: int = LAST_VERSION_WORKERS
+    ) -> Dict[str, str]:
+        """
+        캐시에 없는 태스크의 마지막 버전을 병렬로 조회합니다.
+        조회에 실패한 태스크는 캐시하지 않고 {task_id: 오류 메시지}로 반환합니다.
+        """
+        with self._lock:
+            missing = [task_id for task_id in set(task_ids) if task_id not in self.last_versions]
+        if not missing:
+            return {}
+        logger.info(f"Fetching last versions for {len(missing)} tasks")
+
+        def fetch(task_id: str):
+            try:
+                previews = client.get_all_preview_files_for_task({"id": task_id})
+                return max((int(p.get("revision", 0)) for p in previews or []), default=0), None
+            except Exception as e:
+                logger.warning(f"Failed to get previews for task {task_id}: {e}")
+                return None, str(e)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(fetch, missing))
+        errors = {task_id: error for task_id, (_, error) in zip(missing, results) if error is not None}
+        with self._lock:
+            self.last_versions.update(
+                (task_id, version) for task_id, (version, error) in zip(missing, results) if error is None
+            )
+        return errors
+
+    def forget_last_version(self, task_id: str):
+        """퍼블리시 후 다음 계획에서 다시 조회하도록 캐시에서 제거"""
+        with self._lock:
+            self.last_versions.pop(task_id, None)
+
+class ProjectStateCache:
+    """(세션 키, 프로젝트 ID) 별 ProjectState 캐시"""
+
+    def __init__(self, ttl: float = PROJECT_STATE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._states: Dict[Tuple[Optional[str], str], ProjectState] = {}
+
+    def get(self, client: KitsuClient, project_id: str, refresh: bool = False) -> ProjectState:
+        key = (client.session_key, project_id)
+        with self._lock:
+            state = self._states.get(key)
+        if state is None or refresh or not state.is_fresh(self.ttl):
+            state = ProjectState.load(client, project_id)
+            with self._lock:
+                self._states[key] = state
+        return state
+
+    def forget_last_version(self, task_id: str):
+        with self._lock:
+            states = list(self._states.values())
+        for state in states:
+            state.forget_last_version(task_id)
+
+def _resolve(state: ProjectState, item: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    if not item.get("shot_name"):
+        return None, None
+    shot = state.find_shot(item.get("sequence_name") or "", item["shot_name"])
+    if not shot:
+        return None, None
+    return shot, state.find_task(shot["id"], item.get("task_name") or "")
+
+def build_plan(client: KitsuClient, state: ProjectState, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    스캔 결과 전체를 한 번에 분류합니다.
+    샷/태스크별로 가장 높은 로컬 버전 하나만 퍼블리시 후보로 고르고, 나머지는
+    outdated(더 새 버전 존재) 또는 duplicate(같은 버전 파일 중복)로 표시합니다.
+    결과는 입력 순서를 유지합니다.
+    """
+    resolved = [_resolve(state, item) for item in items]
+    errors = state.ensure_last_versions(client, (task["id"] for _, task in resolved if task))
+
+    plan: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    groups: Dict[str, List[int]] = {}
+    for idx, (item, (shot, task)) in enumerate(zip(items, resolved)):
+        entry = {
+            "file_path": item["file_path"],
+            "filename": item.get("filename"),
+            "sequence_name": item.get("sequence_name"),
+            "shot_name": item.get("shot_name"),
+            "task_name": item.get("task_name"),
+            "version": item.get("version"),
+            "shot_id": shot["id"] if shot else None,
+            "task_id": task["id"] if task else None,
+            # 태스크를 직접 고를 수 있도록 매칭된 샷의 태스크 목록 (MatchResponse와 같은 형태)
+            "available_tasks": [
+                {"id": t["id"], "name": t["task_type_name"]} for t in state.tasks_by_shot.get(shot["id"], [])
+            ] if shot else [],
+            "last_version": state.last_versions.get(task["id"]) if task else None,
+            "status": PLAN_UNMATCHED,
+            "selected": False,
+            "reason": None,
+        }
+        plan[idx] = entry
+        if not item.get("shot_name"):
+            entry["reason"] = "Filename does not match the current pattern"
+        elif not shot:
+            entry["reason"] = "No matching shot in Kitsu"
+        elif not task:
+            entry["reason"] = f"Shot has no '{item.get('task_name')}' task"
+        elif task["id"] in errors:
+            # 마지막 버전을 모르면 이미 퍼블리시된 버전을 다시 올릴 수 있으므로 선택하지 않음
+            entry["status"] = PLAN_UNKNOWN
+            entry["reason"] = f"Could not fetch last version from Kitsu: {errors[task['id']]}"
+        else:
+            groups.setdefault(task["id"], []).append(idx)
+
+    for indices in groups.values():
+        # 버전 내림차순, 같은 버전이면 경로 순으로 정렬하여 결정적으로 선택
+        indices.sort(key=lambda i: (-(plan[i]["version"] or 0), plan[i]["file_path"]))
+        chosen = plan[indices[0]]
+        local_version = chosen["version"] or 0
+        last_version = chosen["last_version"]
+
+        if last_version is None or local_version > last_version:
+            chosen["status"], chosen["selected"] = PLAN_NEW, True
+        elif local_version == last_version:
+            chosen["status"], chosen["reason"] = PLAN_ALREADY_PUBLISHED, f"Kitsu already has v{last_version}"
+        else:
+            chosen["status"], chosen["reason"] = PLAN_OUTDATED, f"Kitsu has newer v{last_version}"
+
+        for i in indices[1:]:
+            entry = plan[i]
+            if (entry["version"] or 0) == local_version:
+                entry["status"], entry["reason"] = PLAN_DUPLICATE, f"Same version as {chosen['filename']}"
+            else:
+                entry["status"], entry["reason"] = PLAN_OUTDATED, f"Newer local version v{local_version} exists"
+    return plan
+
+def summarize_plan(plan: List[Dict[str, Any]]) -> Dict[str, int]:
+    statuses = (PLAN_NEW, PLAN_OUTDATED, PLAN_ALREADY_PUBLISHED, PLAN_DUPLICATE, PLAN_UNMATCHED, PLAN_UNKNOWN)
+    counts = {status: 0 for status in statuses}
+    for entry in plan:
+        counts[entry["status"]] += 1
+    return counts
@@ -0,0 +1,36 @@
+import os
+import logging
+from typing import Dict, Any, Optional
+
+from services.kitsu_client import KitsuClient
+
+logger = logging.getLogger("kitsu_publisher")
+
+DEFAULT_COMMENT = "Published via Batch Publisher"
+
+def publish_item(
+    client: KitsuClient,
+    file_path: str,
+    task_id: str,
+    task_status_id: str,
+    comment: Optional[str] = None,
+) -> Dict[str, Any]:
+    """태스크에 코멘트(상태 변경)를 남기고 프리뷰 파일을 업로드합니다."""
+    filename = os.path.basename(file_path)
+    logger.info(f"Starting publish for: {filename}")
+    try:
+        logger.info(f"  - Getting task and status for {filename}")
+        task = client.get_task(task_id)
+        task_status = client.get_task_status(task_status_id)
+
+        logger.info(f"  - Adding comment for {filename}")
+        kitsu_comment = client.add_comment(task, task_status, comment or DEFAULT_COMMENT)
+
+        logger.info(f"  - Uploading preview file for {filename} (This may take a while...)")
+        client.add_preview(task, kitsu_comment, file_path)
+
+        logger.info(f"Successfully published: {filename}")
+        return {"file_path": file_path, "status": "success"}
+    except Exception as e:
+        logger.error(f"Publish failed for {file_path}: {e}")
+        return {"file_path": file_path, "status": "error", "message": str(e)}
@@ -0,0 +1,57 @@
+import os
+import logging
+from typing import Dict, Any, Iterator, List
+
+from services.parser import ParseCache
+
+logger = logging.getLogger("kitsu_publisher")
+
+VIDEO_EXTENSIONS = {".mov", ".mp4"}
+
+def iter_video_files(directory: str) -> Iterator[str]:
+    """디렉터리를 재귀적으로 돌며 숨김 파일을 제외한 영상 파일 경로를 반환합니다."""
+    for root, _, files in os.walk(directory):
+        for file in files:
+            if file.startswith('.'):
+                continue
+            ext = os.path.splitext(file)[1].lower()
+            if ext in VIDEO_EXTENSIONS:
+                yield os.path.join(root, file)
+
+def scan_files(
+    directory: str,
+    project_id: str,
+    project_config: Dict[str, Any],
+    config_version: int,
+    parse_cache: ParseCache,
+) -> Iterator[Dict[str, Any]]:
+    """
+    영상 파일을 찾아 파일명을 파싱한 결과를 하나씩 반환합니다.
+    패턴에 맞지 않는 파일은 시퀀스/샷/태스크가 빈 문자열로 채워집니다.
+    """
+    for file_path in iter_video_files(directory):
+        file = os.path.basename(file_path)
+        parsed = parse_cache.parse(config_version, project_id, file, project_config)
+        if not parsed:
+            parsed = {"episode_name": None, "sequence_name": "", "shot_name": "", "task_name": "", "version": None}
+        yield {"file_path": file_path, "filename": file, **parsed}
+
+def group_latest_versions(items) -> List[Dict[str, Any]]:
+    """
+    샷+태스크 기준으로 묶고 각 그룹의 최신 버전 파일을 대표로 선택합니다.
+    (프론트엔드 퍼블리시 화면의 그룹화 규칙과 동일)
+    """
+    groups: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if item["shot_name"]:
+            group_key = f"{item['shot_name']}_{item['task_name']}"
+        else:
+            group_key = f"unmatched_{item['filename']}"
+        group = groups.setdefault(group_key, {"all_versions": []})
+        group["all_versions"].append(item)
+
+    results = []
+    for group in groups.values():
+        versions = sorted(group["all_versions"], key=lambda v: v["version"] or 0, reverse=True)
+        results.append({**versions[0], "all_versions": versions})
+    return results
@@ -0,0 +1,191 @@
+import os
+import gzip
+import hashlib
+import logging
+import mimetypes
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import Response, PlainTextResponse
+
+try:
+    import brotli
+except ImportError:  # 의존성이 설치되지 않은 환경에서는 gzip만 사용
+    brotli = None
+
+logger = logging.getLogger("kitsu_publisher")
+
+# 해시가 포함된 파일명으로 빌드되는 SvelteKit 정적 자산 경로
+IMMUTABLE_PREFIX = "_app/immutable/"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+# 이 크기보다 작은 파일은 압축 이득이 거의 없으므로 원본만 보관
+MIN_COMPRESS_SIZE = 1024
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/xml",
+    "image/svg+xml",
+)
+
+@dataclass
+class StaticAsset:
+    body: bytes
+    media_type: str
+    etag: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+    cache_control: str = DEFAULT_CACHE_CONTROL
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith(COMPRESSIBLE_TYPES)
+
+def _load_asset(path: str, rel_path: str) -> StaticAsset:
+    with open(path, 'rb') as f:
+        body = f.read()
+
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type == "application/javascript":
+        media_type += "; charset=utf-8"
+    # 강한 ETag: 내용 해시 기반이므로 인코딩별로 구분 가능하도록 접미사를 붙여 사용
+    etag = hashlib.sha256(body).hexdigest()[:32]
+
+    asset = StaticAsset(body=body, media_type=media_type, etag=etag)
+    if rel_path.startswith(IMMUTABLE_PREFIX):
+        asset.cache_control = IMMUTABLE_CACHE_CONTROL
+
+    if _should_compress(asset):
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            asset.encoded["gzip"] = compressed
+    return asset
+
+def _should_compress(asset: StaticAsset) -> bool:
+    return len(asset.body) >= MIN_COMPRESS_SIZE and _is_compressible(asset.media_type)
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    result = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[token] = q
+    return result
+
+class PrecompressedStaticFiles:
+    """
+    프론트엔드 빌드 결과물을 시작 시 메모리에 올려두고 서빙하는 ASGI 앱.
+
+    - gzip 압축본을 미리 만들어 Accept-Encoding에 따라 응답
+      (br 압축본은 시작을 늦추지 않도록 백그라운드에서 만들고, 준비되기 전까지는 gzip으로 응답)
+    - 내용 해시 기반 강한 ETag와 If-None-Match 조건부 요청(304) 지원
+    - `_app/immutable` 아래 해시 파일은 장기 캐시, 나머지는 매번 재검증(no-cache)
+    - 확장자가 없는 경로는 SPA fallback(index.html)으로 응답
+    """
+
+    def __init__(self, directory: str, fallback: str = "index.html"):
+        self.directory = directory
+        self.fallback = fallback
+        self.assets: Dict[str, StaticAsset] = {}
+        self._load_directory()
+        if brotli is not None:
+            threading.Thread(target=self._compress_brotli, name="brotli-precompress", daemon=True).start()
+
+    def _load_directory(self):
+        total, compressed = 0, 0
+        for root, _, files in os.walk(self.directory):
+            for file in files:
+                path = os.path.join(root, file)
+                rel_path = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                asset = _load_asset(path, rel_path)
+                self.assets[rel_path] = asset
+                total += len(asset.body)
+                compressed += len(asset.encoded.get("gzip", asset.body))
+        logger.info(
+            f"Loaded {len(self.assets)} static assets "
+            f"({total // 1024} KiB, {compressed // 1024} KiB gzip)"
+        )
+
+    def _compress_brotli(self):
+        """최고 압축률(quality 11)은 느리므로 서버 시작 후 백그라운드에서 자산별로 추가"""
+        for asset in list(self.assets.values()):
+            if not _should_compress(asset):
+                continue
+            try:
+                compressed = brotli.compress(asset.body, quality=11)
+            except Exception as e:
+                logger.warning(f"Brotli compression failed: {e}")
+                return
+            if len(compressed) < len(asset.encoded.get("gzip", asset.body)):
+                asset.encoded["br"] = compressed
+        logger.info("Brotli variants of static assets are ready")
+
+    def _resolve(self, path: str) -> Optional[StaticAsset]:
+        rel_path = path.lstrip("/")
+        candidates = [rel_path] if rel_path else []
+        candidates += [f"{rel_path}.html", f"{rel_path}/index.html".lstrip("/")]
+        for candidate in candidates:
+            asset = self.assets.get(candidate)
+            if asset is not None:
+                return asset
+        # 클라이언트 라우팅 경로(/publish 등)는 index.html로 처리
+        if "." not in rel_path.rsplit("/", 1)[-1]:
+            return self.assets.get(self.fallback)
+        return None
+
+    def _choose_encoding(self, asset: StaticAsset, headers: Headers) -> Optional[str]:
+        if not asset.encoded:
+            return None
+        accepted = _accepted_encodings(headers.get("accept-encoding", ""))
+        for encoding in ("br", "gzip"):
+            if encoding in asset.encoded and accepted.get(encoding, 0) > 0:
+                return encoding
+        return None
+
+    def get_response(self, path: str, headers: Headers, method: str) -> Response:
+        if method not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405)
+
+        asset = self._resolve(path)
+        if asset is None:
+            return PlainTextResponse("Not Found", status_code=404)
+
+        encoding = self._choose_encoding(asset, headers)
+        etag = f'"{asset.etag}-{encoding}"' if encoding else f'"{asset.etag}"'
+        response_headers = {
+            "etag": etag,
+            "cache-control": asset.cache_control,
+        }
+        if asset.encoded:
+            response_headers["vary"] = "Accept-Encoding"
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            if etag in tags or "*" in tags:
+                return Response(status_code=304, headers=response_headers)
+
+        body = asset.encoded[encoding] if encoding else asset.body
+        if encoding:
+            response_headers["content-encoding"] = encoding
+        if method == "HEAD":
+            response_headers["content-length"] = str(len(body))
+            return Response(status_code=200, headers=response_headers, media_type=asset.media_type)
+        return Response(content=body, headers=response_headers, media_type=asset.media_type)
+
+    async def __call__(self, scope, receive, send):
+        assert scope["type"] == "http"
+        response = self.get_response(scope["path"], Headers(scope=scope), scope["method"])
+        await response(scope, receive, send)
@@ -0,0 +1,139 @@
+import io
+import os
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Optional
+
+from services.mp4 import extract_poster
+
+logger = logging.getLogger("kitsu_publisher")
+
+# 썸네일 생성 동시 작업 수
+THUMBNAIL_WORKERS = 4
+# 썸네일 긴 변 기본/최대 크기 (px)
+THUMBNAIL_SIZE = 160
+MAX_THUMBNAIL_SIZE = 512
+# 디스크 캐시 최대 용량 (초과 시 오래 사용하지 않은 썸네일부터 삭제)
+THUMBNAIL_CACHE_BYTES = 64 * 1024 * 1024
+# 용량 계산 시 항목 하나의 최소 크기 (포스터 없음 표시용 빈 파일도 파일시스템 블록을 차지)
+MIN_ENTRY_BYTES = 4096
+JPEG_QUALITY = 85
+
+class ThumbnailCache:
+    """
+    영상 포스터 썸네일 디스크 캐시.
+    키는 파일 경로/크기/수정 시각과 썸네일 크기로 만들어 파일이 바뀌면 자동으로 새로 생성됩니다.
+    포스터가 없는 파일은 빈 파일로 기록하여 다시 파싱하지 않습니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = THUMBNAIL_CACHE_BYTES, workers: int = THUMBNAIL_WORKERS):
+        self.cache_dir = cache_dir or os.path.join(os.path.expanduser('~'), '.kitsu_publisher_data', 'thumbnails')
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # 같은 썸네일을 동시에 요청하면 생성 작업을 공유
+        self._pending: Dict[str, Future] = {}
+        # 캐시 디렉터리 사용량 (처음 정리할 때 계산)
+        self._total_bytes: Optional[int] = None
+
+    def cache_key(self, path: str, size: int) -> str:
+        stat = os.stat(path)
+        identity = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{size}"
+        return hashlib.sha1(identity.encode('utf-8')).hexdigest()
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.jpg")
+
+    def submit(self, path: str, size: int = THUMBNAIL_SIZE) -> Future:
+        """
+        썸네일 파일 경로(포스터 이미지가 없는 영상이면 None)를 결과로 갖는 Future를 반환합니다.
+        캐시에 있으면 이미 완료된 Future를, 없으면 워커 풀에서 생성하는 작업을 반환합니다.
+        """
+        key = self.cache_key(path, size)
+        cache_path = self._cache_path(key)
+        try:
+            # 최근 사용 시각 갱신 (LRU)
+            os.utime(cache_path)
+            done: Future = Future()
+            done.set_result(cache_path if os.path.getsize(cache_path) > 0 else None)
+            return done
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="thumbnail")
+                future = self._pool.submit(self._generate, path, size, cache_path)
+                self._pending[key] = future
+                future.add_done_callback(lambda _: self._forget_pending(key))
+        return future
+
+    def _forget_pending(self, key: str):
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def _generate(self, path: str, size: int, cache_path: str) -> Optional[str]:
+        """
+        파일 읽기/캐시 쓰기 오류는 그대로 올리고 아무것도 캐시하지 않습니다.
+        포스터가 없거나 디코딩할 수 없는 이미지일 때만 빈 파일로 기록합니다.
+        """
+        from PIL import Image
+
+        thumbnail = b""
+        poster = extract_poster(path)
+        if poster:
+            try:
+                with Image.open(io.BytesIO(poster)) as image:
+                    image.thumbnail((size, size))
+                    output = io.BytesIO()
+                    image.convert("RGB").save(output, format="JPEG", quality=JPEG_QUALITY)
+                    thumbnail = output.getvalue()
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                # 메모리의 이미지 데이터를 디코딩하다 난 오류이므로 파일이 바뀌기 전까지 결과가 같음
+                logger.warning(f"Failed to decode poster image in {path}: {e}")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # 쓰다 만 임시 파일이 남지 않도록 정리
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict(max(len(thumbnail), MIN_ENTRY_BYTES))
+        return cache_path if thumbnail else None
+
+    def _evict(self, added: int):
+        """용량을 넘으면 가장 오래 사용하지 않은 썸네일부터 삭제"""
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += added
+                if self._total_bytes <= self.max_bytes:
+                    return
+            stats = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.name.endswith('.jpg'):
+                    stat = entry.stat()
+                    stats.append((stat.st_mtime, max(stat.st_size, MIN_ENTRY_BYTES), entry.path))
+            total = sum(size for _, size, _ in stats)
+            if total > self.max_bytes:
+                # 매번 다시 정리하지 않도록 최대 용량의 90%까지 줄임
+                target = self.max_bytes * 9 // 10
+                for _, size, path in sorted(stats):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        continue
+                    total -= size
+                    if total <= target:
+                        break
+                logger.debug(f"Thumbnail cache trimmed to {total} bytes")
+            self._total_bytes = total
@@ -1,27 +1,46 @@
-import requests
+import os
+import json
+import time
 import logging
+import threading
 import webbrowser
-from packaging import version
+from concurrent.futures import Future
+from typing import Optional, Dict, Any
 from version import VERSION, REPO_OWNER, REPO_NAME
 
 logger = logging.getLogger("kitsu_publisher")
 
+# 업데이트 확인 결과 캐시 유지 시간 (초)
+UPDATE_CHECK_TTL = 6 * 60 * 60
+# 확인 실패(오프라인 등) 결과 캐시 유지 시간 (초)
+UPDATE_ERROR_TTL = 5 * 60
+
 class Updater:
-    def __init__(self):
+    def __init__(self, cache_ttl: float = UPDATE_CHECK_TTL, error_ttl: float = UPDATE_ERROR_TTL):
         self.current_version = VERSION
         self.github_url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/releases/latest"
+        self.cache_ttl = cache_ttl
+        self.error_ttl = error_ttl
+        self.cache_file = os.path.join(os.path.expanduser('~'), '.kitsu_publisher_data', 'update_check.json')
+        self._lock = threading.Lock()
+        # 진행 중인 확인 작업 (동시에 여러 곳에서 요청해도 GitHub에는 한 번만 요청)
+        self._pending: Optional[Future] = None
 
     def check_for_updates(self):
+        # requests/packaging은 실제로 확인할 때만 로드 (앱 시작 속도 개선)
+        import requests
+        from packaging import version
+
         try:
             logger.info(f"Checking for updates... (Current: {self.current_version})")
             # 타임아웃 3초 설정 (앱 실행 속도 저하 방지)
             response = requests.get(self.github_url, timeout=3)
-            
+
             if response.status_code == 200:
                 data = response.json()
                 latest_tag = data.get("tag_name", "").lstrip("v")
                 html_url = data.get("html_url", "")
-                
+
                 if not latest_tag:
                     return {"update_available": False}
 
@@ -34,12 +53,87 @@ class Updater:
                         "latest_version": latest_tag,
                         "download_url": html_url
                     }
-            
-            return {"update_available": False, "current_version": self.current_version}
-            
+
+                return {"update_available": False, "current_version": self.current_version}
+
+            # 403(rate limit) 등은 실패로 기록하여 짧은 TTL로만 캐시
+            logger.warning(f"Update check failed with HTTP {response.status_code}")
+            return {
+                "update_available": False,
+                "error": f"HTTP {response.status_code}",
+                "current_version": self.current_version,
+            }
+
         except Exception as e:
             logger.warning(f"Failed to check updates: {e}")
             return {"update_available": False, "error": str(e), "current_version": self.current_version}
 
+    def _read_cache(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # 앱이 업데이트되었으면 이전 버전 기준의 결과는 무시
+        if cached.get("current_version") != self.current_version:
+            return None
+        return cached
+
+    def _write_cache(self, result: Dict[str, Any]):
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_path = self.cache_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({**result, "checked_at": time.time()}, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to write update cache: {e}")
+
+    def refresh(self) -> Dict[str, Any]:
+        """GitHub에 다시 확인하고 결과를 디스크 캐시에 저장합니다."""
+        result = self.check_for_updates()
+        result.setdefault("current_version", self.current_version)
+        # 실패 결과도 짧게 캐시하여 오프라인일 때 매번 타임아웃을 기다리지 않음
+        self._write_cache(result)
+        return result
+
+    def _refresh_shared(self) -> Future:
+        """진행 중인 확인이 있으면 그 결과를 공유하고, 없으면 백그라운드에서 새로 시작합니다."""
+        with self._lock:
+            if self._pending is not None:
+                return self._pending
+            future = self._pending = Future()
+
+        def run():
+            try:
+                future.set_result(self.refresh())
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._pending = None
+
+        threading.Thread(target=run, name="update-check", daemon=True).start()
+        return future
+
+    def refresh_in_background(self):
+        self._refresh_shared()
+
+    def get_update_info(self) -> Dict[str, Any]:
+        """
+        캐시된 업데이트 정보를 반환합니다.
+        캐시가 만료되었으면 오래된 값을 그대로 돌려주고 백그라운드에서 갱신하며,
+        캐시가 아예 없을 때만 확인이 끝날 때까지 기다립니다.
+        """
+        cached = self._read_cache()
+        if cached is None:
+            return self._refresh_shared().result()
+
+        checked_at = cached.pop("checked_at", 0)
+        ttl = self.error_ttl if "error" in cached else self.cache_ttl
+        if time.time() - checked_at > ttl:
+            self.refresh_in_background()
+        return cached
+
     def open_download_page(self, url):
         webbrowser.open(url)